@@ -122,38 +122,19 @@ def sites():
 def reformat():
     """Re-format all completed transcriptions using the latest formatter."""
     from crowdtrans.database import SessionLocal, init_db
-    from crowdtrans.models import Transcription
-    from crowdtrans.transcriber.formatter import format_transcript
+    from crowdtrans.transcriber.learner import reformat_transcriptions
     init_db()
+    click.echo("Re-formatting completed transcriptions...")
     with SessionLocal() as session:
-        txns = (
-            session.query(Transcription)
-            .filter(Transcription.status == "complete", Transcription.transcript_text.isnot(None))
-            .all()
-        )
-        click.echo(f"Re-formatting {len(txns)} completed transcriptions...")
-        for i, txn in enumerate(txns, 1):
-            _pn = " ".join(p for p in [txn.patient_given_names, txn.patient_family_name] if p) or None
-            txn.formatted_text = format_transcript(
-                txn.transcript_text,
-                modality_code=txn.modality_code,
-                procedure_description=txn.procedure_description,
-                clinical_history=txn.complaint,
-                doctor_id=txn.doctor_id,
-                patient_name=_pn,
-                patient_ur=txn.patient_ur,
-            )
-            if i % 50 == 0:
-                session.commit()
-                click.echo(f"  {i}/{len(txns)} done")
-        session.commit()
-        click.echo(f"Done. Re-formatted {len(txns)} transcriptions.")
+        count = reformat_transcriptions(session)
+    click.echo(f"Done. Re-formatted {count} transcriptions.")
 
 
 @cli.command()
 @click.option("--reformat", is_flag=True, help="After learning, re-apply the formatter to all completed transcriptions (can re-run the LLM — expensive).")
 @click.option("--no-reformat", is_flag=True, hidden=True, help="Deprecated: reformat is now off by default.")
-def learn(reformat, no_reformat):
+@click.option("--full-rebuild", is_flag=True, help="Discard saved learner state and re-analyze every pair (use after formatter changes).")
+def learn(reformat, no_reformat, full_rebuild):
     """Analyze transcript-report pairs, update doctor profiles, and discover new rules.
 
     Compares all completed Visage transcriptions against their final reports to:
@@ -164,6 +145,9 @@ def learn(reformat, no_reformat):
 
     Reformatting is OFF by default — pass --reformat to also re-apply the
     formatter to every transcription (this can re-run the LLM on each row).
+
+    Learning is incremental: only pairs added since the last run are
+    analyzed. Pass --full-rebuild to start over from every transcription.
     """
     from crowdtrans.database import init_db
     from crowdtrans.transcriber.learner import run_learning
@@ -171,7 +155,7 @@ def learn(reformat, no_reformat):
     if no_reformat:
         click.echo("(--no-reformat is now the default; flag has no effect)")
     init_db()
-    results = run_learning(reformat=reformat)
+    results = run_learning(reformat=reformat, full_rebuild=full_rebuild)
 
     stats = results["stats"]
     click.echo(f"\nLearning complete:")
@@ -1,7 +1,10 @@
+import functools
 import logging
 from contextlib import contextmanager
 
+import sqlalchemy
 from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
 
 from crowdtrans.config import settings
@@ -38,8 +41,6 @@ def _migrate_add_columns(engine_):
     SQLite doesn't support ALTER TABLE ADD COLUMN IF NOT EXISTS,
     so we check column existence first via PRAGMA table_info.
     """
-    import sqlalchemy
-
     new_columns = {
         "transcriptions": [
             ("llm_formatted_text", "TEXT"),
@@ -58,6 +59,12 @@ def _migrate_add_columns(engine_):
             ("final_text", "TEXT"),
             ("priority_name", "TEXT"),
             ("priority_rank", "INTEGER"),
+            ("compare_similarity", "REAL"),
+            ("compare_llm_similarity", "REAL"),
+            ("compare_hash", "TEXT"),
+        ],
+        "watermark": [
+            ("adaptive_batch_size", "INTEGER"),
         ],
     }
 
@@ -74,12 +81,91 @@ def _migrate_add_columns(engine_):
             conn.commit()
 
 
+def _migrate_add_indexes(engine_):
+    """Create indexes declared on the models that existing tables lack.
+
+    create_all() only builds indexes alongside new tables, so indexes added
+    to an existing model later are created here.
+    """
+    with engine_.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+
+# Columns behind the transcriptions list's free-text search
+SEARCH_COLUMNS = (
+    "accession_number",
+    "patient_family_name",
+    "patient_given_names",
+    "patient_ur",
+    "transcript_text",
+    "procedure_description",
+)
+SEARCH_TABLE = "transcriptions_search"
+
+
+def _migrate_search_index(engine_):
+    """Create the trigram FTS5 index used for substring search.
+
+    It is an external-content table over transcriptions, kept in sync by
+    triggers, so a phrase MATCH answers ``col LIKE '%q%'`` across all the
+    search columns from one index. Needs SQLite 3.34+ built with FTS5;
+    without it the list search keeps using plain ILIKE.
+    """
+    cols = ", ".join(SEARCH_COLUMNS)
+    new_cols = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+    old_cols = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+    delete_old = (
+        f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_cols});"
+    )
+    insert_new = f"INSERT INTO {SEARCH_TABLE}(rowid, {cols}) VALUES (new.id, {new_cols});"
+
+    with engine_.begin() as conn:
+        exists = conn.execute(
+            sqlalchemy.text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": SEARCH_TABLE},
+        ).first()
+        if exists:
+            return
+        try:
+            conn.execute(sqlalchemy.text(
+                f"CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5({cols}, "
+                f"content='transcriptions', content_rowid='id', tokenize='trigram')"
+            ))
+        except OperationalError as e:
+            logger.warning("Trigram search index unavailable (%s); list search will scan", e)
+            return
+        conn.execute(sqlalchemy.text(
+            f"CREATE TRIGGER {SEARCH_TABLE}_ai AFTER INSERT ON transcriptions BEGIN {insert_new} END"
+        ))
+        conn.execute(sqlalchemy.text(
+            f"CREATE TRIGGER {SEARCH_TABLE}_ad AFTER DELETE ON transcriptions BEGIN {delete_old} END"
+        ))
+        conn.execute(sqlalchemy.text(
+            f"CREATE TRIGGER {SEARCH_TABLE}_au AFTER UPDATE OF {cols} ON transcriptions "
+            f"BEGIN {delete_old} {insert_new} END"
+        ))
+        conn.execute(sqlalchemy.text(f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')"))
+        logger.info("Built trigram search index %s", SEARCH_TABLE)
+
+
+@functools.lru_cache(maxsize=1)
+def has_search_index() -> bool:
+    with engine.connect() as conn:
+        return conn.execute(
+            sqlalchemy.text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": SEARCH_TABLE},
+        ).first() is not None
+
+
 def init_db():
     settings.sqlite_db_path.parent.mkdir(parents=True, exist_ok=True)
     Base.metadata.create_all(engine)
 
     # Migrate: add new columns to existing tables
     _migrate_add_columns(engine)
+    _migrate_add_indexes(engine)
+    _migrate_search_index(engine)
 
     # Seed site_configs + global_settings from .env on first run
     store = get_config_store()
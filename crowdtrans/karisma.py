@@ -1,6 +1,12 @@
 """Read-only MSSQL client for Karisma RIS dictation data."""
 
+import atexit
+import html
 import logging
+import queue
+import re
+import time
+from collections.abc import Iterator
 from typing import Any
 
 import pymssql
@@ -142,8 +148,52 @@ WHERE [Key] = %d
 """
 
 
+# Idle connections kept per Karisma database, and how long one may sit idle
+# before it is assumed dropped by the server or a firewall and discarded.
+_POOL_MAX_IDLE = 4
+_POOL_IDLE_SECONDS = 300
+
+_POOLS: dict[tuple, queue.LifoQueue] = {}
+
+
+class _PooledConnection:
+    """pymssql connection whose close() hands it back to the pool.
+
+    Callers keep the usual ``conn = _get_connection(site) ... conn.close()``
+    shape; everything else is delegated to the real connection.
+    """
+
+    def __init__(self, conn, pool: queue.LifoQueue):
+        self._conn = conn
+        self._pool = pool
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            # End any open transaction so the next borrower starts clean
+            conn.rollback()
+            self._pool.put_nowait((conn, time.monotonic()))
+        except (pymssql.Error, queue.Full):
+            conn.close()
+
+
 def _get_connection(site: SiteConfig):
-    return pymssql.connect(
+    key = (site.db_host, site.db_port, site.db_name, site.db_user, site.db_password)
+    pool = _POOLS.setdefault(key, queue.LifoQueue(maxsize=_POOL_MAX_IDLE))
+    while True:
+        try:
+            conn, idle_since = pool.get_nowait()
+        except queue.Empty:
+            break
+        if time.monotonic() - idle_since < _POOL_IDLE_SECONDS:
+            return _PooledConnection(conn, pool)
+        conn.close()
+    conn = pymssql.connect(
         server=site.db_host,
         port=site.db_port,
         database=site.db_name,
@@ -153,6 +203,19 @@ def _get_connection(site: SiteConfig):
         timeout=120,
         as_dict=True,
     )
+    return _PooledConnection(conn, pool)
+
+
+@atexit.register
+def _close_pools() -> None:
+    for pool in _POOLS.values():
+        while True:
+            try:
+                conn, _ = pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+    _POOLS.clear()
 
 
 def fetch_new_dictations(site: SiteConfig, after_id: int, limit: int) -> list[dict[str, Any]]:
@@ -204,9 +267,13 @@ WHERE RIV.BlobKey IS NOT NULL
 """
 
 
+# One scan over the report XML picks up paragraph boundaries and text runs
+_REPORT_TOKEN_RE = re.compile(r"<(Paragraph|Text|/Paragraph)[^>]*>([^<]*)")
+_REPORT_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
 def _parse_report_xml(xml_bytes: bytes) -> str:
     """Extract plain text from Karisma WordProcessor XML report."""
-    import re
     try:
         text = xml_bytes.decode("utf-8")
     except UnicodeDecodeError:
@@ -219,7 +286,7 @@ def _parse_report_xml(xml_bytes: bytes) -> str:
     paragraphs = []
     current_para = []
 
-    for match in re.finditer(r"<(Paragraph|Text|/Paragraph)[^>]*>([^<]*)", text):
+    for match in _REPORT_TOKEN_RE.finditer(text):
         tag = match.group(1)
         content = match.group(2).strip()
         if tag == "Text" and content:
@@ -231,10 +298,11 @@ def _parse_report_xml(xml_bytes: bytes) -> str:
                 paragraphs.append("")  # empty paragraph = blank line
             current_para = []
 
-    # Join paragraphs, collapse multiple blank lines
+    # Join paragraphs, collapse multiple blank lines, decode XML entities
+    # (&amp;, &lt;, &#160; ...) in one C pass over the joined text
     result = "\n".join(paragraphs)
-    result = re.sub(r"\n{3,}", "\n\n", result)
-    return result.strip()
+    result = _REPORT_BLANK_LINES_RE.sub("\n\n", result)
+    return html.unescape(result).strip()
 
 
 WORKLIST_SYNC_QUERY = """\
@@ -385,16 +453,18 @@ def fetch_worklist_sync_state_by_accession(
         conn.close()
 
 
-def fetch_reports(site: SiteConfig, transaction_keys: list[int]) -> dict[int, str]:
-    """Fetch typed report text for a batch of dictation TransactionKeys.
+def iter_reports(site: SiteConfig, transaction_keys: list[int]) -> Iterator[tuple[int, str]]:
+    """Stream (transaction_key, plain_text_report) for reports that exist.
 
-    Returns {transaction_key: plain_text_report} for reports that exist.
+    Each row is parsed and yielded as it comes off the TDS stream, so a
+    caller that handles one report at a time never holds every report XML
+    blob in memory. The connection stays open until the generator is
+    exhausted or closed.
     """
     if not transaction_keys:
-        return {}
+        return
     conn = _get_connection(site)
     try:
-        reports = {}
         batch_size = 200
         for i in range(0, len(transaction_keys), batch_size):
             batch = transaction_keys[i:i + batch_size]
@@ -406,12 +476,19 @@ def fetch_reports(site: SiteConfig, transaction_keys: list[int]) -> dict[int, st
                     xml_bytes = bytes(row["ReportXML"])
                     text = _parse_report_xml(xml_bytes)
                     if text and len(text) > 20:
-                        reports[row["DictationTK"]] = text
-        return reports
+                        yield row["DictationTK"], text
     finally:
         conn.close()
 
 
+def fetch_reports(site: SiteConfig, transaction_keys: list[int]) -> dict[int, str]:
+    """Fetch typed report text for a batch of dictation TransactionKeys.
+
+    Returns {transaction_key: plain_text_report} for reports that exist.
+    """
+    return dict(iter_reports(site, transaction_keys))
+
+
 PRE_DICTATION_REPORT_QUERY = """\
 SELECT TOP 1 E.Buffer
 FROM [Version].[Karisma.Report.InstanceChange] RIC
@@ -576,30 +653,42 @@ ORDER BY RN.NoteStyle ASC, RN.TransactionKey DESC
 """
 
 
+# Text runs and paragraph breaks in a note, picked up in one scan
+_WP_TOKEN_RE = re.compile(r"<Text[^>]*>([^<]+)</Text>|</Paragraph>\s*<Paragraph[^>]*>")
+_WP_TAG_RE = re.compile(r"<[^>]+>")
+_WP_SPACE_RE = re.compile(r"\s+")
+
+
 def _extract_plain_text_from_wp_xml(raw: bytes) -> str:
     """Extract plain text from Kestral WordProcessor XML format."""
-    import re as _re
     try:
         try:
             xml_text = raw.decode("utf-8")
         except UnicodeDecodeError:
             xml_text = raw.decode("utf-16-le")
 
-        texts = _re.findall(r"<Text[^>]*>([^<]+)</Text>", xml_text)
-        if texts:
-            parts = _re.split(r"</Paragraph>\s*<Paragraph[^>]*>", xml_text)
-            if len(parts) > 1:
-                paragraphs = []
-                for part in parts:
-                    part_texts = _re.findall(r"<Text[^>]*>([^<]+)</Text>", part)
-                    if part_texts:
-                        paragraphs.append(" ".join(part_texts))
+        paragraphs = []
+        current_para = []
+        split = False
+        for match in _WP_TOKEN_RE.finditer(xml_text):
+            content = match.group(1)
+            if content is not None:
+                current_para.append(content)
+            else:
+                split = True
+                if current_para:
+                    paragraphs.append(" ".join(current_para))
+                    current_para = []
+        if current_para:
+            paragraphs.append(" ".join(current_para))
+
+        if paragraphs:
+            if split:
                 return "\n".join(p for p in paragraphs if p.strip())
-            return " ".join(texts)
+            return paragraphs[0]
 
-        plain = _re.sub(r"<[^>]+>", " ", xml_text)
-        plain = _re.sub(r"\s+", " ", plain).strip()
-        return plain
+        plain = _WP_TAG_RE.sub(" ", xml_text)
+        return _WP_SPACE_RE.sub(" ", plain).strip()
     except Exception as e:
         logger.warning("Failed to extract text from WP XML: %s", e)
         return ""
@@ -12,6 +12,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase
 
@@ -59,6 +60,8 @@ class Watermark(Base):
     site_id = Column(String, nullable=False, unique=True)
     last_dictation_id = Column(BigInteger, nullable=False, default=0)
     last_poll_at = Column(DateTime, nullable=True)
+    # AIMD-tuned batch size carried across service restarts (NULL = use site.batch_size)
+    adaptive_batch_size = Column(Integer, nullable=True)
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
 
 
@@ -162,6 +165,12 @@ class Transcription(Base):
     verified_by = Column(String, nullable=True)
     final_text = Column(Text, nullable=True)  # frozen formatted_text + signature at verify time
 
+    # Cached compare-page similarity against the typed RIS report; the hash
+    # covers both texts so a reformat or report edit invalidates it
+    compare_similarity = Column(Float, nullable=True)
+    compare_llm_similarity = Column(Float, nullable=True)
+    compare_hash = Column(String, nullable=True)
+
     # Priority (from Karisma Request.PriorityType — ReportCompletion)
     priority_name = Column(String, nullable=True)
     priority_rank = Column(Integer, nullable=True)  # 1=most urgent (Immediate), 2=ASAP, 3=Same_Day, 4+=Routine/Low
@@ -177,6 +186,7 @@ class Transcription(Base):
         Index("ix_site_id", "site_id"),
         Index("ix_status", "status"),
         Index("ix_accession_number", "accession_number"),
+        Index("ix_patient_ur", "patient_ur"),
         Index("ix_patient_family_name", "patient_family_name"),
         Index("ix_doctor_family_name", "doctor_family_name"),
         Index("ix_modality_code", "modality_code"),
@@ -184,6 +194,26 @@ class Transcription(Base):
         Index("ix_site_source", "site_id", "source_dictation_id"),
         Index("ix_worklist_status", "worklist_status"),
         Index("ix_priority_rank", "priority_rank"),
+        # Per-site status counts and status-filtered scans.
+        Index("ix_site_status_source", "site_id", "status", "source_dictation_id"),
+        # Poller queue: only pending rows, already in priority order.
+        Index(
+            "ix_pending_queue", "site_id", "priority_rank", "source_dictation_id",
+            sqlite_where=text("status = 'pending'"),
+        ),
+        # Compare list: per-site status filter, newest dictation first.
+        Index("ix_txn_compare", "site_id", "status", dictation_date.desc()),
+        # Dashboard "recently completed" list.
+        Index("ix_txn_recent", "status", transcription_completed_at.desc()),
+        # Distinct-modality dropdowns.
+        Index("ix_txn_modality", "site_id", "modality_code"),
+        # Transcriptions list (dictation_date DESC, id DESC) filtered by site
+        # or status; scanned backwards, so the columns stay ascending.
+        Index("ix_txn_site_date", "site_id", "dictation_date", "id"),
+        Index("ix_txn_status_date", "status", "dictation_date", "id"),
+        # Doctor name filters: SQLite's LIKE is case-insensitive, so a
+        # prefix LIKE can only seek an index built with NOCASE collation.
+        Index("ix_txn_doctor_nocase", doctor_family_name.collate("NOCASE")),
     )
 
 
@@ -1,11 +1,14 @@
 """Deepgram Nova-3 Medical transcription wrapper."""
 
+import atexit
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
 
+import httpx
 from deepgram import DeepgramClient, FileSource, PrerecordedOptions
 
 from crowdtrans.config import settings
@@ -154,20 +157,55 @@ def _get_api_key() -> str:
     return store.get_global("deepgram_api_key") or settings.deepgram_api_key
 
 
-def transcribe_file(audio_path: Path, keyterms: list[str] | None = None) -> TranscriptionResult:
-    """Transcribe an audio file from disk (Visage .opus files)."""
-    client = DeepgramClient(_get_api_key())
+class _SharedTransport(httpx.HTTPTransport):
+    """Connection pool that outlives the per-request httpx.Client.
 
-    with open(audio_path, "rb") as f:
-        buffer_data = f.read()
+    The Deepgram SDK opens and closes a fresh httpx.Client around every
+    request, which would close any transport handed to it; ignoring that
+    close keeps TLS connections alive between transcriptions.
+    """
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
+
+
+_TRANSPORT = _SharedTransport(
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+atexit.register(_TRANSPORT.shutdown)
 
-    payload: FileSource = {"buffer": buffer_data}
+_client: DeepgramClient | None = None
+_client_key: str | None = None
+
+
+def _get_client() -> DeepgramClient:
+    """Shared Deepgram client, rebuilt if the API key is changed in settings."""
+    global _client, _client_key
+    api_key = _get_api_key()
+    if _client is None or api_key != _client_key:
+        _client = DeepgramClient(api_key)
+        _client_key = api_key
+    return _client
+
+
+def transcribe_file(audio_path: Path, keyterms: list[str] | None = None) -> TranscriptionResult:
+    """Transcribe an audio file from disk (Visage .opus files)."""
+    client = _get_client()
     options = _build_options(keyterms)
 
-    logger.info("Sending %s to Deepgram (%d bytes)", audio_path.name, len(buffer_data))
-    start = time.monotonic()
-    response = client.listen.rest.v("1").transcribe_file(payload, options)
-    elapsed_ms = int((time.monotonic() - start) * 1000)
+    # Stream the file as the request body rather than reading it into memory
+    with open(audio_path, "rb") as f:
+        payload: FileSource = {"stream": f}
+        logger.info("Sending %s to Deepgram (%d bytes)", audio_path.name, os.fstat(f.fileno()).st_size)
+        start = time.monotonic()
+        response = client.listen.rest.v("1").transcribe_file(payload, options, transport=_TRANSPORT)
+        elapsed_ms = int((time.monotonic() - start) * 1000)
 
     result = _parse_response(response)
     result.processing_duration_ms = elapsed_ms
@@ -181,14 +219,14 @@ def transcribe_buffer(
     label: str = "blob",
 ) -> TranscriptionResult:
     """Transcribe audio bytes from memory (Karisma SQL blobs)."""
-    client = DeepgramClient(_get_api_key())
+    client = _get_client()
 
     payload: FileSource = {"buffer": audio_data}
     options = _build_options(keyterms)
 
     logger.info("Sending %s to Deepgram (%d bytes, %s)", label, len(audio_data), content_type)
     start = time.monotonic()
-    response = client.listen.rest.v("1").transcribe_file(payload, options)
+    response = client.listen.rest.v("1").transcribe_file(payload, options, transport=_TRANSPORT)
     elapsed_ms = int((time.monotonic() - start) * 1000)
 
     result = _parse_response(response)
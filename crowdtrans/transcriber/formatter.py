@@ -907,6 +907,48 @@ _SPINE_LEVEL_SUBHEADING = re.compile(
     re.IGNORECASE
 )
 
+# Hot-path dispatch tables for _classify_paragraph. Binding each pattern's
+# .search method once at import skips the per-call attribute lookup on ~100
+# compiled patterns per paragraph. Opener order matters: PROCEDURE, then
+# CONCLUSION, then FINDINGS (first match wins).
+_SPINE_LEVEL_MATCH = _SPINE_LEVEL_SUBHEADING.match
+_SPOKEN_MARKER_SEARCHES = tuple((p.search, section) for p, section in _SPOKEN_SECTION_MARKERS)
+_OPENER_SEARCHES = (
+    tuple((p.search, "PROCEDURE") for p in _PROCEDURE_OPENERS)
+    + tuple((p.search, "CONCLUSION") for p in _CONCLUSION_OPENERS)
+    + tuple((p.search, "FINDINGS") for p in _FINDINGS_OPENERS)
+)
+_KEYWORD_WORDS_FINDALL = re.compile(r'[a-z]+(?:-[a-z]+)*').findall
+
+# Section order doubles as the tie-break order for keyword scoring.
+_SCORED_SECTIONS = ("CLINICAL HISTORY", "PROCEDURE", "FINDINGS", "CONCLUSION")
+
+
+def _build_keyword_scorer():
+    """Compile the static keyword sets into one straight-line scoring function.
+
+    The keyword sets never change at runtime, so each keyword is emitted as a
+    literal ``in`` test against the token set. The generated function returns
+    one score per entry in _SCORED_SECTIONS.
+    """
+    keyword_sets = (
+        _CLINICAL_HISTORY_KEYWORDS,
+        _PROCEDURE_KEYWORDS,
+        _FINDINGS_KEYWORDS,
+        _CONCLUSION_KEYWORDS,
+    )
+    lines = ["def _score_tokens(t):"]
+    for i, keywords in enumerate(keyword_sets):
+        terms = " + ".join(f"({kw!r} in t)" for kw in sorted(keywords)) or "0"
+        lines.append(f"    s{i} = {terms}")
+    lines.append("    return (" + ", ".join(f"s{i}" for i in range(len(keyword_sets))) + ")")
+    namespace: dict = {}
+    exec(compile("\n".join(lines), "<formatter keyword scorer>", "exec"), namespace)  # noqa: S102
+    return namespace["_score_tokens"]
+
+
+_score_tokens = _build_keyword_scorer()
+
 
 def _classify_paragraph(text: str, modality_code: str | None = None) -> tuple[str | None, str]:
     """Classify a paragraph into a report section based on content.
@@ -921,12 +963,12 @@ def _classify_paragraph(text: str, modality_code: str | None = None) -> tuple[st
     # 0. Check if this is a spine level sub-heading (e.g. "L4/5: ...")
     #    If so, do NOT classify it as a new section -- return None so it
     #    inherits the current section (should be FINDINGS)
-    if _SPINE_LEVEL_SUBHEADING.match(text_stripped):
+    if _SPINE_LEVEL_MATCH(text_stripped):
         return None, text_stripped
 
     # 1. Check for explicit spoken section markers
-    for pattern, section in _SPOKEN_SECTION_MARKERS:
-        m = pattern.search(text_stripped)
+    for search, section in _SPOKEN_MARKER_SEARCHES:
+        m = search(text_stripped)
         if m:
             # Strip the spoken marker from the paragraph text
             remainder = text_stripped[m.end():].lstrip(' ,.:;-\n')
@@ -938,20 +980,12 @@ def _classify_paragraph(text: str, modality_code: str | None = None) -> tuple[st
             return section, remainder
 
     # 2. Check opening phrase patterns (text is not modified for these)
-    for pattern in _PROCEDURE_OPENERS:
-        if pattern.search(text_stripped):
-            return "PROCEDURE", text_stripped
-
-    for pattern in _CONCLUSION_OPENERS:
-        if pattern.search(text_stripped):
-            return "CONCLUSION", text_stripped
-
-    for pattern in _FINDINGS_OPENERS:
-        if pattern.search(text_stripped):
-            return "FINDINGS", text_stripped
+    for search, section in _OPENER_SEARCHES:
+        if search(text_stripped):
+            return section, text_stripped
 
     # 3. Keyword scoring
-    words = set(re.findall(r'[a-z]+(?:-[a-z]+)*', text_lower))
+    words = set(_KEYWORD_WORDS_FINDALL(text_lower))
     # Also check bigrams for multi-word keywords
     bigrams = set()
     word_list = text_lower.split()
@@ -960,34 +994,12 @@ def _classify_paragraph(text: str, modality_code: str | None = None) -> tuple[st
 
     all_tokens = words | bigrams
 
-    scores = {
-        "CLINICAL HISTORY": 0,
-        "PROCEDURE": 0,
-        "FINDINGS": 0,
-        "CONCLUSION": 0,
-    }
-
-    for kw in _CLINICAL_HISTORY_KEYWORDS:
-        if kw in all_tokens:
-            scores["CLINICAL HISTORY"] += 1
-
-    for kw in _PROCEDURE_KEYWORDS:
-        if kw in all_tokens:
-            scores["PROCEDURE"] += 1
-
-    for kw in _FINDINGS_KEYWORDS:
-        if kw in all_tokens:
-            scores["FINDINGS"] += 1
+    scores = _score_tokens(all_tokens)
 
-    for kw in _CONCLUSION_KEYWORDS:
-        if kw in all_tokens:
-            scores["CONCLUSION"] += 1
-
-    # Get the top-scoring section
-    max_score = max(scores.values())
+    # Get the top-scoring section (ties go to the earliest section)
+    max_score = max(scores)
     if max_score >= 2:
-        best = max(scores, key=scores.get)
-        return best, text_stripped
+        return _SCORED_SECTIONS[scores.index(max_score)], text_stripped
 
     return None, text_stripped
 
@@ -1349,6 +1361,9 @@ def _strip_procedure_echo(text: str, procedure_description: str) -> str:
     return text
 
 
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\n+')
+
+
 def add_section_headings(
     text: str,
     modality_code: str | None = None,
@@ -1402,17 +1417,21 @@ def add_section_headings(
         text = _strip_procedure_echo(text, procedure_description)
 
     # Split transcript into paragraphs
-    paragraphs = [p.strip() for p in re.split(r'\n\n+', text) if p.strip()]
+    paragraphs = [p.strip() for p in _PARAGRAPH_SPLIT_RE.split(text) if p.strip()]
 
     if not paragraphs:
         return "\n".join(lines) if lines else text
 
-    # Classify each paragraph (returns section + cleaned text)
-    classified = []
+    # Classify each paragraph (returns section + cleaned text). Sections and
+    # paragraph text are kept in parallel lists so the fix-up pass below can
+    # reassign sections in place without rebuilding tuples.
+    sections: list[str | None] = []
+    paras: list[str] = []
     for para in paragraphs:
         section, cleaned = _classify_paragraph(para, modality_code)
         if cleaned:  # Skip empty paragraphs (just a section name with no content)
-            classified.append((section, cleaned))
+            sections.append(section)
+            paras.append(cleaned)
 
     # Apply defaults for unclassified paragraphs using context
     # Rules:
@@ -1422,27 +1441,24 @@ def add_section_headings(
     section_order = {"CLINICAL HISTORY": 0, "PROCEDURE": 1, "FINDINGS": 2, "CONCLUSION": 3}
     highest_section_seen = -1
 
-    for i, (section, para) in enumerate(classified):
+    for i, section in enumerate(sections):
         if section is None:
-            if i > 0 and classified[i - 1][0] is not None:
-                classified[i] = (classified[i - 1][0], para)
+            if i > 0 and sections[i - 1] is not None:
+                sections[i] = sections[i - 1]
             else:
-                classified[i] = ("FINDINGS", para)
+                sections[i] = "FINDINGS"
         else:
             # Prevent backwards section transitions (e.g. CONCLUSION -> FINDINGS)
             current_order = section_order.get(section, 2)
             if current_order < highest_section_seen:
                 # Keep the current highest section
-                prev_section = classified[i - 1][0] if i > 0 else "FINDINGS"
-                classified[i] = (prev_section, para)
+                sections[i] = sections[i - 1] if i > 0 else "FINDINGS"
             else:
                 highest_section_seen = max(highest_section_seen, current_order)
 
     # If no CLINICAL HISTORY was provided and no paragraph was classified as
     # CLINICAL HISTORY, skip that heading entirely
-    has_clinical_history = clinical_history or any(
-        s == "CLINICAL HISTORY" for s, _ in classified
-    )
+    has_clinical_history = clinical_history or "CLINICAL HISTORY" in sections
 
     # Determine whether to include CONCLUSION section.
     # Check doctor profile first; fall back to modality-level heuristic (CR rarely uses it).
@@ -1450,14 +1466,12 @@ def add_section_headings(
     if doctor_conclusion is False:
         # Doctor rarely uses CONCLUSION for this modality — only include if
         # the classifier explicitly detected conclusion content
-        include_conclusion = any(s == "CONCLUSION" for s, _ in classified)
+        include_conclusion = "CONCLUSION" in sections
     elif doctor_conclusion is True:
         include_conclusion = True
     else:
         # No doctor profile — use legacy CR heuristic
-        include_conclusion = modality_code != "CR" or any(
-            s == "CONCLUSION" for s, _ in classified
-        )
+        include_conclusion = modality_code != "CR" or "CONCLUSION" in sections
 
     # Build output with headings, only inserting a heading when the section changes.
     # Match RIS report formatting: headings on their own line, content immediately
@@ -1466,7 +1480,7 @@ def add_section_headings(
     # Skip CLINICAL HISTORY heading if it was already added from the referral
     already_added_clinical = bool(clinical_history)
 
-    for section, para in classified:
+    for section, para in zip(sections, paras):
         # Filter: only use headings available for this modality
         if section not in available_headings:
             # Map to closest available heading
@@ -4,8 +4,11 @@ Terms ranked by frequency from analysis of 15,000+ Visage reports.
 High-frequency terms get priority within Deepgram's 100-keyterm limit.
 """
 
+import functools
 import json
 import logging
+import re
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -357,68 +360,178 @@ MODALITY_TERMS: dict[str, list[str]] = {
     ],
 }
 
+# Dedup state for the static term lists, built once at import. get_keyterms()
+# only has to lowercase and probe the small per-study dynamic terms.
+_BASE_KEYS = frozenset(t.lower().strip() for t in BASE_TERMS)
 
-def get_keyterms(
-    modality_code: str | None = None,
-    patient_name_parts: list[str] | None = None,
-    doctor_name: str | None = None,
-    referrer_name: str | None = None,
-    procedure_description: str | None = None,
-    doctor_id: str | None = None,
-) -> list[str]:
-    """Build a keyterm list for a specific study, capped at 100.
 
-    Per-doctor terms (from learned profile + word_replacements) are inserted
-    after modality-specific terms so they survive the 100-term cap.
+def _prepare_modality_terms() -> dict[str, tuple[tuple[str, ...], frozenset[str]]]:
+    """Per modality: (terms not already in BASE_TERMS in order, their keys)."""
+    prepared = {}
+    for code, mod_terms in MODALITY_TERMS.items():
+        seen = set(_BASE_KEYS)
+        ordered = []
+        for t in mod_terms:
+            key = t.lower().strip()
+            if key not in seen:
+                seen.add(key)
+                ordered.append(t)
+        prepared[code] = (tuple(ordered), frozenset(seen - _BASE_KEYS))
+    return prepared
+
+
+_MOD_PREPARED = _prepare_modality_terms()
+
+
+# Significant procedure-description words: 4+ letters, minus laterality/filler
+_PROC_WORD_RE = re.compile(r"[A-Za-z][A-Za-z\-']{3,}")
+_PROC_STOP = frozenset({"with", "without", "left", "right", "both"})
+
+
+# Deepgram accepts at most this many keyterms per request
+_KEYTERM_CAP = 100
+
+
+# Domain keyterms (everything but the patient name) are cached per study
+# type. The TTL bounds how stale per-doctor terms can get after the learner
+# or a word-replacement edit changes them in another process.
+_DOMAIN_CACHE_TTL = 300
+
+# Extra tail terms kept beyond the cap so that patient name parts which
+# duplicate a tail term don't leave the merged list short.
+_PATIENT_HEADROOM = 10
+
+
+def _extend_unique(unique: list[str], seen: set[str], terms, cap: int = _KEYTERM_CAP) -> None:
+    """Append terms not yet seen (case/whitespace-insensitive), in order.
+
+    Stops consuming ``terms`` once the list reaches ``cap``, so lazy
+    iterables further down the pipeline are never evaluated.
     """
-    terms = list(BASE_TERMS)
+    if len(unique) >= cap:
+        return
+    for t in terms:
+        key = t.lower().strip()
+        if key not in seen:
+            seen.add(key)
+            unique.append(t)
+            if len(unique) >= cap:
+                return
+
+
+def _dictionary_matches(karisma_dict: list[str], proc_lower: set[str]):
+    """Yield dictionary terms that share a root with a procedure word."""
+    for term in karisma_dict:
+        term_lower = term.lower()
+        if any(pw in term_lower or term_lower in pw for pw in proc_lower):
+            yield term
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_domain_keyterms(
+    modality_code: str | None,
+    doctor_name: str | None,
+    referrer_name: str | None,
+    procedure_description: str | None,
+    doctor_id: str | None,
+    _epoch: int,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    # BASE_TERMS is already unique, so it seeds the result as-is.
+    unique = list(BASE_TERMS)
+    seen = set(_BASE_KEYS)
 
     # Per-doctor terms come BEFORE the modality block so they survive the 100-term cap.
     # These are words historically mis-heard by Deepgram for this specific doctor —
     # the highest-signal boost we have, second only to the always-on BASE_TERMS.
-    terms.extend(_doctor_db_keyterms(doctor_id))
-    terms.extend(_doctor_profile_keyterms(doctor_id, modality_code))
-
-    # Add modality-specific terms
-    if modality_code and modality_code in MODALITY_TERMS:
-        terms.extend(MODALITY_TERMS[modality_code])
-
-    # Context boosting: names and procedure
+    _extend_unique(unique, seen, _doctor_db_keyterms(doctor_id))
+    _extend_unique(unique, seen, _doctor_profile_keyterms(doctor_id, modality_code))
+
+    # Add modality-specific terms (pre-deduplicated against BASE_TERMS)
+    prepared = _MOD_PREPARED.get(modality_code) if modality_code else None
+    if prepared:
+        mod_terms, mod_keys = prepared
+        if seen.isdisjoint(mod_keys):
+            unique.extend(mod_terms)
+            seen |= mod_keys
+        else:
+            # A doctor term already claimed one of these keys; fall back to
+            # the per-term walk so ordering matches first occurrence.
+            _extend_unique(unique, seen, mod_terms)
+
+    # BASE_TERMS + modality usually fill the cap on their own — skip the
+    # context, custom and dictionary work entirely when they do.
+    if len(unique) >= _KEYTERM_CAP:
+        return tuple(unique[:_KEYTERM_CAP]), ()
+    head = len(unique)
+    cap = _KEYTERM_CAP + _PATIENT_HEADROOM
+
+    # Context boosting: names and procedure (patient names are merged in
+    # per study by get_keyterms, ahead of these)
     context_terms = []
-    if patient_name_parts:
-        context_terms.extend([p for p in patient_name_parts if len(p) > 2])
     if doctor_name:
         context_terms.append(doctor_name)
     if referrer_name:
         context_terms.append(referrer_name)
-    if procedure_description:
-        # Add significant words from procedure description
-        for word in procedure_description.split():
-            if len(word) > 3 and word.lower() not in {"with", "without", "left", "right", "both"}:
-                context_terms.append(word)
+    proc_words = _PROC_WORD_RE.findall(procedure_description) if procedure_description else []
+    # Add significant words from procedure description
+    context_terms.extend(w for w in proc_words if w.lower() not in _PROC_STOP)
 
-    terms.extend(context_terms)
+    _extend_unique(unique, seen, context_terms, cap)
 
     # Add user-defined custom keyterms
-    terms.extend(_load_custom_keyterms())
+    _extend_unique(unique, seen, _load_custom_keyterms(), cap)
 
     # Add relevant terms from Karisma medical dictionary
     # Filter by procedure description words to stay within the 100-term cap
-    karisma_dict = _load_karisma_dictionary()
-    if karisma_dict and procedure_description:
-        proc_words = {w.lower() for w in procedure_description.split() if len(w) > 3}
-        for term in karisma_dict:
-            term_lower = term.lower()
-            # Include dictionary terms that share a root with procedure words
-            if any(pw in term_lower or term_lower in pw for pw in proc_words):
-                terms.append(term)
-
-    # Deduplicate while preserving order, cap at 100
-    seen = set()
-    unique = []
-    for t in terms:
-        key = t.lower().strip()
-        if key not in seen:
-            seen.add(key)
-            unique.append(t)
-    return unique[:100]
+    if len(unique) < cap and proc_words:
+        karisma_dict = _load_karisma_dictionary()
+        if karisma_dict:
+            proc_lower = {w.lower() for w in proc_words}
+            # Lazy: the scan stops as soon as the cap is reached
+            _extend_unique(unique, seen, _dictionary_matches(karisma_dict, proc_lower), cap)
+
+    return tuple(unique[:head]), tuple(unique[head:])
+
+
+def get_domain_keyterms(
+    modality_code: str | None = None,
+    doctor_name: str | None = None,
+    referrer_name: str | None = None,
+    procedure_description: str | None = None,
+    doctor_id: str | None = None,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Keyterms that don't depend on the patient, cached per study type.
+
+    Returns ``(head, tail)``: patient name parts belong between the two.
+    """
+    return _cached_domain_keyterms(
+        modality_code, doctor_name, referrer_name, procedure_description, doctor_id,
+        int(time.monotonic() // _DOMAIN_CACHE_TTL),
+    )
+
+
+def get_keyterms(
+    modality_code: str | None = None,
+    patient_name_parts: list[str] | None = None,
+    doctor_name: str | None = None,
+    referrer_name: str | None = None,
+    procedure_description: str | None = None,
+    doctor_id: str | None = None,
+) -> list[str]:
+    """Build a keyterm list for a specific study, capped at _KEYTERM_CAP (100).
+
+    Per-doctor terms (from learned profile + word_replacements) are inserted
+    after modality-specific terms so they survive the 100-term cap.
+    """
+    head, tail = get_domain_keyterms(
+        modality_code, doctor_name, referrer_name, procedure_description, doctor_id,
+    )
+    patient_terms = [p for p in patient_name_parts or () if len(p) > 2]
+    if not patient_terms or len(head) >= _KEYTERM_CAP:
+        return list((head + tail)[:_KEYTERM_CAP])
+
+    unique = list(head)
+    seen = {t.lower().strip() for t in head}
+    _extend_unique(unique, seen, patient_terms)
+    _extend_unique(unique, seen, tail)
+    return unique
@@ -9,14 +9,27 @@ Designed to run periodically (via CLI command + systemd timer) so the system
 improves automatically as more transcriptions accumulate.
 """
 
-import json
+import contextlib
+import datetime
+import hashlib
 import logging
+import multiprocessing
+import os
+import pickle
 import re
-from collections import Counter, defaultdict
-from difflib import SequenceMatcher
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import orjson
+from rapidfuzz.distance import Indel
+
+from sqlalchemy import and_, or_
+
 from crowdtrans.config_store import get_config_store
 from crowdtrans.database import SessionLocal
 from crowdtrans.models import Transcription, TranscriptionEdit
@@ -29,6 +42,8 @@ _DATA_DIR_DEV = Path(__file__).resolve().parent.parent.parent / "data"
 
 PROFILES_FILENAME = "doctor_profiles.json"
 SUGGESTIONS_FILENAME = "learning_suggestions.json"
+SUMMARIES_FILENAME = "profile_summaries.json"
+STATE_FILENAME = "learner_state.pkl"
 
 
 def _get_data_dir() -> Path:
@@ -41,11 +56,14 @@ def _get_data_dir() -> Path:
 
 # ── Section structure extraction ──────────────────────────────────────────
 
-_HEADING_RE = re.compile(
-    r"\b(CLINICAL HISTORY|CLINICAL INDICATION|CLINICAL DETAILS|"
-    r"FINDINGS|CONCLUSION|PROCEDURE|TECHNIQUE|IMPRESSION|COMMENT|REPORT)\b"
+# Report heading words, shared by section extraction and text normalisation
+_HEADINGS_ALT = (
+    "CLINICAL HISTORY|CLINICAL INDICATION|CLINICAL DETAILS|"
+    "FINDINGS|CONCLUSION|PROCEDURE|TECHNIQUE|IMPRESSION|COMMENT|REPORT"
 )
 
+_HEADING_RE = re.compile(rf"\b({_HEADINGS_ALT})\b")
+
 # Canonical heading mapping
 _HEADING_CANONICAL = {
     "CLINICAL HISTORY": "CLINICAL HISTORY",
@@ -61,9 +79,8 @@ _HEADING_CANONICAL = {
 }
 
 
-def _extract_section_sequence(report_text: str) -> list[str]:
-    """Extract the sequence of section headings from a report."""
-    plain = report_text
+def _extract_section_sequence_from_text(plain: str) -> list[str]:
+    """Extract the sequence of section headings from plain report text."""
     headings = []
     seen = set()
     for m in _HEADING_RE.finditer(plain):
@@ -76,63 +93,95 @@ def _extract_section_sequence(report_text: str) -> list[str]:
 
 # ── Word-level comparison ─────────────────────────────────────────────────
 
-_NORMALISE_RE = re.compile(
-    r"^\s*(CLINICAL HISTORY|CLINICAL INDICATION|CLINICAL DETAILS|"
-    r"FINDINGS|CONCLUSION|PROCEDURE|TECHNIQUE|IMPRESSION|COMMENT|REPORT)\s*$",
-    re.MULTILINE,
-)
+_NORMALISE_RE = re.compile(rf"^\s*({_HEADINGS_ALT})\s*$", re.MULTILINE)
+
+
+_TOKEN_RE = re.compile(r"[a-z]+(?:[-'][a-z]+)*|\d+(?:\.\d+)?")
 
 
 def _normalise_text(text: str) -> str:
-    """Normalise text for word comparison — strip headings and extra whitespace."""
+    """Normalise text for word comparison — strip headings and lowercase.
+
+    Blank-line runs are left alone: _tokenize ignores whitespace, so
+    collapsing them would only cost another full-string copy.
+    """
     if not text:
         return ""
-    text = _NORMALISE_RE.sub("", text)
-    text = re.sub(r"\n{2,}", "\n\n", text)
-    return text.strip().lower()
+    return _NORMALISE_RE.sub("", text).strip().lower()
 
 
 def _tokenize(text: str) -> list[str]:
-    """Split into words for comparison."""
-    return re.findall(r"[a-z]+(?:[-'][a-z]+)*|\d+(?:\.\d+)?", text.lower())
+    """Split into words for comparison.
 
+    Expects already-lowercased text (e.g. from _normalise_text) — the token
+    pattern only matches lowercase letters. Tokens are interned: the
+    vocabulary is small, so repeated words in a document share one object
+    and pickle back from the worker pool as memo references.
+    """
+    return list(map(sys.intern, _TOKEN_RE.findall(text)))
 
-def _find_word_replacements(
-    our_tokens: list[str], report_tokens: list[str]
-) -> list[tuple[str, str]]:
-    """Find word- and short-phrase replacements between transcript and report.
 
-    Returns (transcript_phrase, report_phrase) tuples from 'replace' opcodes
-    up to length 3 on either side, so multi-word mishears like
-    'near fusion' -> 'knee effusion' are captured alongside single-word ones.
+def _diff_tokens(
+    our_tokens: list[str], report_tokens: list[str]
+) -> tuple[float, list[tuple[str, str]]]:
+    """Diff two token lists once, returning (similarity ratio, replacements).
+
+    Uses rapidfuzz's C++ Indel opcodes over tokens, an alignment on the
+    longest common subsequence. The ratio is 2*matched/total over its
+    'equal' spans (the same value as Indel.normalized_similarity), so no
+    second diff is needed.
+
+    Indel has no 'replace' tag: a changed phrase comes out as deletes and
+    inserts. Each run of non-equal opcodes between two equal spans is
+    merged into a single (transcript_phrase, report_phrase) replacement, as
+    difflib would report it. Replacements up to length 3 on either side are kept, so multi-word
+    mishears like 'a fusion' -> 'effusion' or 'near fusion' -> 'knee joint
+    effusion' are captured alongside single-word ones.
     """
-    sm = SequenceMatcher(None, our_tokens, report_tokens, autojunk=False)
+    total = len(our_tokens) + len(report_tokens)
+    if not total:
+        return 1.0, []
+    matched = 0
     replacements = []
-    for tag, i1, i2, j1, j2 in sm.get_opcodes():
-        if tag != "replace":
+    run = None  # (i1, j1, i2, j2) of the current run of non-equal opcodes
+    for tag, i1, i2, j1, j2 in (*Indel.opcodes(our_tokens, report_tokens), ("equal", 0, 0, 0, 0)):
+        if tag != "equal":
+            run = (i1, j1, i2, j2) if run is None else (run[0], run[1], i2, j2)
             continue
-        our_span = our_tokens[i1:i2]
-        report_span = report_tokens[j1:j2]
-        # Skip very long spans — likely structural rewrites, not mishears.
-        if len(our_span) > 3 or len(report_span) > 3 or not our_span or not report_span:
+        matched += i2 - i1
+        if run is None:
+            continue
+        our_span = our_tokens[run[0]:run[2]]
+        report_span = report_tokens[run[1]:run[3]]
+        run = None
+        # Pure insertions/deletions aren't mishears; very long spans are
+        # likely structural rewrites.
+        if not our_span or not report_span or len(our_span) > 3 or len(report_span) > 3:
             continue
         wrong = " ".join(our_span)
         right = " ".join(report_span)
         if wrong == right:
             continue
         replacements.append((wrong, right))
-    return replacements
+    return 2.0 * matched / total, replacements
+
+
+def _find_word_replacements(
+    our_tokens: list[str], report_tokens: list[str]
+) -> list[tuple[str, str]]:
+    """Find word- and short-phrase replacements between two token lists."""
+    return _diff_tokens(our_tokens, report_tokens)[1]
 
 
 # ── Core analysis ─────────────────────────────────────────────────────────
 
 # Words to ignore in correction analysis (too common, not real corrections)
-_NOISE_WORDS = {
+_NOISE_WORDS = frozenset({
     "the", "a", "an", "is", "are", "was", "were", "in", "at", "of", "for",
     "to", "and", "or", "on", "with", "as", "by", "it", "this", "that",
     "no", "not", "be", "has", "have", "had", "do", "does", "did",
     "so", "but", "if", "then", "than", "from", "up", "out", "about",
-}
+})
 
 
 def _is_noise_pair(wrong: str, right: str) -> bool:
@@ -181,8 +230,8 @@ def _mine_edit_corrections() -> Counter:
             continue
         if edit.original_text == edit.edited_text:
             continue
-        wrong_tokens = _tokenize(edit.original_text)
-        right_tokens = _tokenize(edit.edited_text)
+        wrong_tokens = _tokenize(edit.original_text.lower())
+        right_tokens = _tokenize(edit.edited_text.lower())
         if not wrong_tokens or not right_tokens:
             continue
         for wrong, right in _find_word_replacements(wrong_tokens, right_tokens):
@@ -243,8 +292,8 @@ def record_edit_feedback(
     if not original_text or not edited_text or original_text == edited_text:
         return 0
 
-    orig_tokens = _tokenize(original_text)
-    new_tokens = _tokenize(edited_text)
+    orig_tokens = _tokenize(original_text.lower())
+    new_tokens = _tokenize(edited_text.lower())
     pairs = _find_word_replacements(orig_tokens, new_tokens)
     if not pairs:
         return 0
@@ -293,9 +342,252 @@ def record_edit_feedback(
     return inserted
 
 
-def analyze_pairs(limit: int = 0) -> dict[str, Any]:
+def _distinct_words(tokens: list[str]) -> tuple[str, ...]:
+    """Return each token once, as a compact tuple for the parent to count."""
+    return tuple(set(tokens))
+
+
+# Pairs whose token counts differ by more than this factor (e.g. a short
+# addendum dictation against a full report) aren't diffed — the alignment is
+# expensive and its replacements are noise. Word frequencies still count.
+_MAX_LENGTH_RATIO = 3
+
+
+# ── Prepared-report cache ─────────────────────────────────────────────────
+
+REPORT_CACHE_DIRNAME = "cache/reports"
+
+# Size budget for the prepared-report cache; the least recently read
+# entries are evicted by _sweep_report_cache() after each learning run.
+_REPORT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Part of every cache key. Bump when _normalise_text, _tokenize or section
+# extraction change, so entries prepared by the old code are never served.
+_PREPARE_VERSION = 1
+
+_report_cache_dir: Path | None = None
+
+
+def _get_report_cache_dir() -> Path:
+    global _report_cache_dir
+    if _report_cache_dir is None:
+        _report_cache_dir = _get_data_dir() / REPORT_CACHE_DIRNAME
+    return _report_cache_dir
+
+
+def _prepare_report(report_text: str) -> tuple[list[str], list[str]] | None:
+    """Return (tokens, section sequence) for a report, or None if it's empty.
+
+    Results are cached on disk keyed by a hash of the report text (and
+    _PREPARE_VERSION), so full rebuilds and repeated runs skip the
+    normalise/tokenize/heading passes for reports that haven't changed.
+    """
+    h = hashlib.blake2b(report_text.encode("utf-8"), digest_size=16)
+    h.update(b"\0%d" % _PREPARE_VERSION)
+    key = h.hexdigest()
+    path = _get_report_cache_dir() / key[:2] / f"{key}.pkl"
+    try:
+        prepared = pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Discarding unreadable report cache entry %s: %s", path, e)
+    else:
+        # Mark the entry as recently used for _sweep_report_cache; atime
+        # can't be relied on (relatime/noatime mounts).
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        if prepared is None:
+            return None
+        tokens, sections = prepared
+        return list(map(sys.intern, tokens)), sections
+
+    report_norm = _normalise_text(report_text)
+    prepared = (
+        (_tokenize(report_norm), _extract_section_sequence_from_text(report_text))
+        if report_norm else None
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process temp name: several pool workers may prepare the same report
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(pickle.dumps(prepared, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug("Could not write report cache entry %s: %s", path, e)
+    return prepared
+
+
+def _sweep_report_cache(max_bytes: int = _REPORT_CACHE_MAX_BYTES) -> None:
+    """Evict least recently used cache entries until the cache fits max_bytes.
+
+    Recency is the entry's mtime, which _prepare_report refreshes on each hit.
+    """
+    cache_dir = _get_report_cache_dir()
+    if not cache_dir.exists():
+        return
+    entries = []
+    total = 0
+    for path in cache_dir.glob("*/*.pkl"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    if total <= max_bytes:
+        return
+    entries.sort()
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    logger.info("Evicted %d entries from report cache %s", removed, cache_dir)
+
+
+def _analyze_one(txn: dict[str, Any], report_text: str) -> dict[str, Any] | None:
+    """Diff one transcription against its typed report.
+
+    No DB access and no shared in-memory state (the only side effect is the
+    on-disk prepared-report cache), so it can run in a worker process.
+    Returns None if either side is empty after normalisation, and a result
+    with ``skipped`` set (word sets only) if the lengths are too far apart
+    to diff usefully.
+    """
+    our_text = txn["formatted_text"]
+
+    # Strip procedure title from our text for comparison
+    if txn["procedure_description"]:
+        proc_upper = txn["procedure_description"].upper().strip()
+        lines = our_text.split("\n")
+        if lines and lines[0].strip().upper() == proc_upper:
+            lines = lines[1:]
+        our_text = "\n".join(lines)
+
+    # Normalise + tokenize both (the report side via the disk cache)
+    our_norm = _normalise_text(our_text)
+    if not our_norm:
+        return None
+    prepared = _prepare_report(report_text)
+    if prepared is None:
+        return None
+    report_tokens, sections = prepared
+    our_tokens = _tokenize(our_norm)
+
+    la, lb = len(our_tokens), len(report_tokens)
+    if min(la, lb) == 0 or max(la, lb) > _MAX_LENGTH_RATIO * min(la, lb):
+        return {
+            "skipped": True,
+            "our_words": _distinct_words(our_tokens),
+            "report_words": _distinct_words(report_tokens),
+        }
+
+    # Similarity + word replacements (single tokens + short phrases up
+    # to 3 words) from a single diff
+    ratio, replacements = _diff_tokens(our_tokens, report_tokens)
+
+    return {
+        "skipped": False,
+        "doctor_id": txn["doctor_id"],
+        "doctor_name": txn["doctor_name"],
+        "modality": txn["modality_code"] or "UNKNOWN",
+        "ratio": ratio,
+        "corrections": [p for p in replacements if not _is_noise_pair(*p)],
+        "our_words": _distinct_words(our_tokens),
+        "report_words": _distinct_words(report_tokens),
+        "sections": sections,
+    }
+
+
+# Worker pools are spawned, never forked: learning and reformatting also run
+# inside the multithreaded web server, and a forked child can inherit a lock
+# (e.g. logging's) that another thread held at fork time and deadlock on it.
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+# Pairs handed to the worker pool at a time — keeps memory bounded while
+# reports are still streaming in from Karisma.
+_ANALYZE_WINDOW = 1024
+
+
+def _analyze_all(
+    pairs: Iterable[tuple[dict[str, Any], str]],
+) -> Iterator[dict[str, Any] | None]:
+    """Run _analyze_one over (txn, report_text) pairs across all cores."""
+    it = iter(pairs)
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=_POOL_CONTEXT) as ex:
+        while window := list(islice(it, _ANALYZE_WINDOW)):
+            txns, reports = zip(*window)
+            yield from ex.map(_analyze_one, txns, reports, chunksize=32)
+
+
+# ── Incremental state ─────────────────────────────────────────────────────
+
+# Bump when the shape of the pickled accumulators changes; older state files
+# are then ignored and the next run rebuilds from scratch.
+_STATE_VERSION = 3
+
+# Each run covers transcriptions completed up to this long before it starts.
+# Ids are assigned at discovery and rows complete out of order (parallel
+# transcription, retries), so the watermark is the completion time; the lag
+# leaves room for a completion stamped just before the run to be committed.
+_COMPLETION_LAG = datetime.timedelta(minutes=10)
+
+# Transcriptions whose typed report didn't exist yet on a previous run are
+# retried on later runs; only the most recent ones are kept.
+_MAX_PENDING = 5000
+
+
+def _new_modality_stats() -> dict[str, Any]:
+    return {
+        "count": 0,
+        "section_structures": Counter(),
+        "section_presence": Counter(),
+        "word_corrections": Counter(),
+        "similarity_sum": 0.0,
+    }
+
+
+def _load_state() -> dict[str, Any] | None:
+    """Load the accumulators persisted by the previous learning run, if any."""
+    path = _get_data_dir() / STATE_FILENAME
+    if not path.exists():
+        return None
+    try:
+        state = pickle.loads(path.read_bytes())
+    except Exception as e:
+        logger.warning("Ignoring unreadable learner state %s: %s", path, e)
+        return None
+    if not isinstance(state, dict) or state.get("version") != _STATE_VERSION:
+        logger.info("Learner state %s is from an older version, rebuilding", path)
+        return None
+    return state
+
+
+def _save_state(state: dict[str, Any]) -> None:
+    """Persist accumulators so the next run only analyzes new pairs."""
+    path = _get_data_dir() / STATE_FILENAME
+    _write_atomic(path, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+    logger.info(
+        "Saved learner state to %s (completed before %s, %d pending)",
+        path, state["completed_before"], len(state["pending_ids"]),
+    )
+
+
+def analyze_pairs(limit: int = 0, full_rebuild: bool = False) -> dict[str, Any]:
     """Analyze all transcript-report pairs and return comprehensive results.
 
+    Runs incrementally: the accumulators from the previous run are loaded from
+    STATE_FILENAME and only transcriptions completed since then (plus recent ones
+    still waiting for a typed report) are fetched and diffed. Pass
+    ``full_rebuild=True`` to discard the saved state and re-analyze everything,
+    e.g. after changing the formatter or the comparison logic. A ``limit``
+    run is treated as a one-off and neither reads nor writes the state.
+
     Returns a dict with:
     - doctor_profiles: per-doctor, per-modality formatting data
     - global_corrections: candidate word corrections across all doctors
@@ -303,33 +595,62 @@ def analyze_pairs(limit: int = 0) -> dict[str, Any]:
     - report_only_words: words frequent in reports but absent in transcripts
     - stats: summary statistics
     """
-    # Fetch all completed Visage transcriptions
+    incremental = limit <= 0
+    state = _load_state() if incremental and not full_rebuild else None
+    pending_ids = state["pending_ids"] if state else []
+    completed_before = datetime.datetime.utcnow() - _COMPLETION_LAG
+
+    # Fetch completed transcriptions not yet covered by the saved state
     with SessionLocal() as session:
+        # Only the columns we need, streamed in chunks — never load full ORM
+        # rows (audio paths, raw transcripts, etc.) for every transcription.
         query = (
-            session.query(Transcription)
+            session.query(
+                Transcription.id,
+                Transcription.source_dictation_id,
+                Transcription.doctor_id,
+                Transcription.doctor_family_name,
+                Transcription.modality_code,
+                Transcription.formatted_text,
+                Transcription.procedure_description,
+            )
             .filter(
                 Transcription.status == "complete",
                 Transcription.formatted_text.isnot(None),
                 Transcription.site_id == "karisma",
             )
         )
+        if state:
+            query = query.filter(or_(
+                and_(
+                    Transcription.transcription_completed_at > state["completed_before"],
+                    Transcription.transcription_completed_at <= completed_before,
+                ),
+                Transcription.id.in_(pending_ids),
+            ))
+        elif incremental:
+            # Rows completed after the cutoff are left for the next run
+            query = query.filter(or_(
+                Transcription.transcription_completed_at.is_(None),
+                Transcription.transcription_completed_at <= completed_before,
+            ))
         if limit > 0:
             query = query.limit(limit)
-        txns = query.all()
-
-        # Extract data while session is open
-        txn_data = []
-        for txn in txns:
-            txn_data.append({
-                "dictation_id": txn.source_dictation_id,
-                "doctor_id": str(txn.doctor_id) if txn.doctor_id else None,
-                "doctor_name": txn.doctor_family_name,
-                "modality_code": txn.modality_code,
-                "formatted_text": txn.formatted_text,
-                "procedure_description": txn.procedure_description,
-            })
 
-    if not txn_data:
+        txn_data = [
+            {
+                "id": row.id,
+                "dictation_id": row.source_dictation_id,
+                "doctor_id": str(row.doctor_id) if row.doctor_id else None,
+                "doctor_name": row.doctor_family_name,
+                "modality_code": row.modality_code,
+                "formatted_text": row.formatted_text,
+                "procedure_description": row.procedure_description,
+            }
+            for row in query.execution_options(stream_results=True).yield_per(1000)
+        ]
+
+    if not txn_data and not state:
         logger.warning("No completed Visage transcriptions found")
         return {"doctor_profiles": {}, "global_corrections": [], "stats": {"pairs": 0}}
 
@@ -341,137 +662,148 @@ def analyze_pairs(limit: int = 0) -> dict[str, Any]:
         logger.error("No Karisma site configured")
         return {"doctor_profiles": {}, "global_corrections": [], "stats": {"pairs": 0}}
 
-    dict_ids = [t["dictation_id"] for t in txn_data]
-
-    from crowdtrans.karisma import fetch_reports
-    reports = fetch_reports(karisma, dict_ids)
-
-    logger.info("Fetched %d Karisma reports for %d transcriptions", len(reports), len(txn_data))
+    txn_by_dict_id = {t["dictation_id"]: t for t in txn_data}
 
     # ── Analyze each pair ──────────────────────────────────────────────
-    # Per-doctor accumulators
-    doctor_data = defaultdict(lambda: {
-        "name": None,
-        "modalities": defaultdict(lambda: {
-            "count": 0,
-            "section_structures": Counter(),
-            "section_presence": Counter(),
-            "word_corrections": Counter(),
-            "similarity_sum": 0.0,
-        }),
-    })
-
-    # Global accumulators
-    global_corrections = Counter()  # (transcript_word, report_word) -> count
-    transcript_word_freq = Counter()
-    report_word_freq = Counter()
-    total_pairs = 0
-    total_similarity = 0.0
-
-    for txn in txn_data:
-        report_text = reports.get(txn["dictation_id"])
-        if not report_text:
-            continue
-        our_text = txn["formatted_text"]
-        doctor_id = txn["doctor_id"]
-        modality = txn["modality_code"] or "UNKNOWN"
-
-        # Strip procedure title from our text for comparison
-        if txn["procedure_description"]:
-            proc_upper = txn["procedure_description"].upper().strip()
-            lines = our_text.split("\n")
-            if lines and lines[0].strip().upper() == proc_upper:
-                lines = lines[1:]
-            our_text = "\n".join(lines)
-
-        # Normalise both
-        our_norm = _normalise_text(our_text)
-        report_norm = _normalise_text(report_text)
-
-        if not our_norm or not report_norm:
+    if state:
+        doctor_mod_stats = state["doctor_mod_stats"]
+        doctor_names = state["doctor_names"]
+        global_corrections = state["global_corrections"]
+        transcript_word_freq = state["transcript_word_freq"]
+        report_word_freq = state["report_word_freq"]
+        total_pairs = state["total_pairs"]
+        total_similarity = state["total_similarity"]
+        logger.info(
+            "Resuming from learner state: %d prior pairs, %d transcriptions to check",
+            total_pairs, len(txn_data),
+        )
+    else:
+        # Per-(doctor, modality) accumulators, flat; nested into profiles below
+        doctor_mod_stats: dict[tuple[str, str], dict[str, Any]] = {}
+        doctor_names: dict[str, str | None] = {}
+
+        # Global accumulators
+        global_corrections = Counter()  # (transcript_word, report_word) -> count
+        transcript_word_freq = Counter()
+        report_word_freq = Counter()
+        total_pairs = 0
+        total_similarity = 0.0
+
+    # Reports are streamed from Karisma and diffed in worker processes as
+    # they arrive; only the Counter merge happens here.
+    from crowdtrans.karisma import iter_reports
+
+    reported_ids: set[int] = set()
+
+    def _pairs() -> Iterator[tuple[dict[str, Any], str]]:
+        for dictation_id, report_text in iter_reports(karisma, list(txn_by_dict_id)):
+            txn = txn_by_dict_id.get(dictation_id)
+            if txn is not None:
+                reported_ids.add(txn["id"])
+                yield txn, report_text
+
+    skipped_pairs = 0
+    for result in _analyze_all(_pairs()):
+        if result is None:
             continue
 
-        total_pairs += 1
+        # Word frequencies
+        transcript_word_freq.update(result["our_words"])
+        report_word_freq.update(result["report_words"])
 
-        # Tokenize
-        our_tokens = _tokenize(our_norm)
-        report_tokens = _tokenize(report_norm)
+        if result["skipped"]:
+            skipped_pairs += 1
+            continue
 
-        # Similarity
-        sm = SequenceMatcher(None, our_tokens, report_tokens, autojunk=False)
-        ratio = sm.ratio()
+        total_pairs += 1
+        ratio = result["ratio"]
         total_similarity += ratio
 
-        # Word frequencies
-        transcript_word_freq.update(set(our_tokens))
-        report_word_freq.update(set(report_tokens))
-
-        # Word replacements (single tokens + short phrases up to 3 words)
-        replacements = _find_word_replacements(our_tokens, report_tokens)
-        for wrong, right in replacements:
-            if _is_noise_pair(wrong, right):
-                continue
-            global_corrections[(wrong, right)] += 1
+        pair_corrections = result["corrections"]
+        global_corrections.update(pair_corrections)
 
         # Section structure from report
-        sections = _extract_section_sequence(report_text)
+        sections = result["sections"]
         section_seq = " > ".join(sections) if sections else "(none)"
 
         # Per-doctor accumulation
+        doctor_id = result["doctor_id"]
         if doctor_id:
-            doc = doctor_data[doctor_id]
-            doc["name"] = txn["doctor_name"]
-            mod = doc["modalities"][modality]
+            doctor_names[doctor_id] = result["doctor_name"]
+            key = (doctor_id, result["modality"])
+            mod = doctor_mod_stats.get(key)
+            if mod is None:
+                mod = doctor_mod_stats[key] = _new_modality_stats()
             mod["count"] += 1
             mod["section_structures"][section_seq] += 1
             for s in sections:
                 mod["section_presence"][s] += 1
             mod["similarity_sum"] += ratio
-            for wrong, right in replacements:
-                if _is_noise_pair(wrong, right):
-                    continue
-                mod["word_corrections"][(wrong, right)] += 1
+            mod["word_corrections"].update(pair_corrections)
+
+    logger.info(
+        "Analyzed %d new pairs from %d transcriptions",
+        len(reported_ids), len(txn_data),
+    )
+    logger.debug(
+        "Skipped diffing %d pairs with token counts more than %dx apart",
+        skipped_pairs, _MAX_LENGTH_RATIO,
+    )
+
+    if incremental:
+        queried_ids = [t["id"] for t in txn_data]
+        _save_state({
+            "version": _STATE_VERSION,
+            "completed_before": completed_before,
+            "pending_ids": sorted(set(queried_ids) - reported_ids)[-_MAX_PENDING:],
+            "doctor_mod_stats": doctor_mod_stats,
+            "doctor_names": doctor_names,
+            "global_corrections": global_corrections,
+            "transcript_word_freq": transcript_word_freq,
+            "report_word_freq": report_word_freq,
+            "total_pairs": total_pairs,
+            "total_similarity": total_similarity,
+        })
 
     # ── Build doctor profiles ──────────────────────────────────────────
     profiles = {}
-    for doctor_id, data in doctor_data.items():
-        profile = {
-            "doctor_name": data["name"],
-            "modalities": {},
-        }
-        for mod_code, mod_data in data["modalities"].items():
-            count = mod_data["count"]
-            if count < 3:
-                continue  # Not enough data
-
-            # Section presence percentages
-            presence_pct = {}
-            for section, cnt in mod_data["section_presence"].items():
-                presence_pct[section] = round(cnt / count * 100, 1)
-
-            # Top word corrections (count >= 2)
-            corrections = [
-                [wrong, right, cnt]
-                for (wrong, right), cnt in mod_data["word_corrections"].most_common(100)
-                if cnt >= 2
-            ]
-
-            profile["modalities"][mod_code] = {
-                "count": count,
-                "avg_similarity": round(mod_data["similarity_sum"] / count * 100, 1),
-                "section_structure": dict(mod_data["section_structures"].most_common(10)),
-                "section_presence_pct": presence_pct,
-                "word_corrections": corrections,
+    for (doctor_id, mod_code), mod_data in doctor_mod_stats.items():
+        count = mod_data["count"]
+        if count < 3:
+            continue  # Not enough data
+
+        # Section presence percentages
+        presence_pct = {}
+        for section, cnt in mod_data["section_presence"].items():
+            presence_pct[section] = round(cnt / count * 100, 1)
+
+        # Top word corrections (count >= 2)
+        corrections = [
+            [wrong, right, cnt]
+            for (wrong, right), cnt in mod_data["word_corrections"].most_common(100)
+            if cnt >= 2
+        ]
+
+        profile = profiles.get(doctor_id)
+        if profile is None:
+            profile = profiles[doctor_id] = {
+                "doctor_name": doctor_names.get(doctor_id),
+                "modalities": {},
             }
-
-        if profile["modalities"]:
-            profiles[doctor_id] = profile
+        profile["modalities"][mod_code] = {
+            "count": count,
+            "avg_similarity": round(mod_data["similarity_sum"] / count * 100, 1),
+            "section_structure": dict(mod_data["section_structures"].most_common(10)),
+            "section_presence_pct": presence_pct,
+            "word_corrections": corrections,
+        }
 
     # ── Mine manual typist edits (TranscriptionEdit) — ground truth ────
     # Each typist edit gets EDIT_WEIGHT extra weight per occurrence because
     # it's labelled correction data, not an inferred pair.
     EDIT_WEIGHT = 5
     edit_pairs = _mine_edit_corrections()
+    global_corrections = global_corrections.copy()  # keep the saved state edit-free
     for (wrong, right), cnt in edit_pairs.items():
         if _is_noise_pair(wrong, right):
             continue
@@ -540,15 +872,60 @@ def analyze_pairs(limit: int = 0) -> dict[str, Any]:
 # ── File output ───────────────────────────────────────────────────────────
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Serialise obj as indented UTF-8 JSON and write it atomically."""
+    _write_atomic(path, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
+
 def save_profiles(profiles: dict, path: Path | None = None) -> Path:
     """Save doctor profiles to JSON file."""
     if path is None:
         path = _get_data_dir() / PROFILES_FILENAME
-    path.write_text(json.dumps(profiles, indent=2, ensure_ascii=False), encoding="utf-8")
+    _write_json(path, profiles)
     logger.info("Saved %d doctor profiles to %s", len(profiles), path)
     return path
 
 
+def summarise_profiles(profiles: dict) -> list[dict]:
+    """Per-doctor totals for the learning dashboard, busiest doctor first."""
+    profile_summaries = []
+    for doc_id, profile in profiles.items():
+        modalities = profile.get("modalities", {})
+        total_count = sum(m.get("count", 0) for m in modalities.values())
+        avg_sim = 0
+        if modalities:
+            sims = [m.get("avg_similarity", 0) for m in modalities.values() if m.get("count", 0) > 0]
+            avg_sim = sum(sims) / len(sims) if sims else 0
+        corrections_count = sum(
+            len(m.get("word_corrections", [])) for m in modalities.values()
+        )
+        profile_summaries.append({
+            "doctor_id": doc_id,
+            "name": profile.get("doctor_name", "Unknown"),
+            "modalities": list(modalities.keys()),
+            "total_count": total_count,
+            "avg_similarity": round(avg_sim, 1),
+            "corrections_count": corrections_count,
+        })
+    profile_summaries.sort(key=lambda x: x["total_count"], reverse=True)
+    return profile_summaries
+
+
+def save_profile_summaries(profiles: dict, path: Path | None = None) -> Path:
+    """Save the dashboard's per-doctor summaries alongside the profiles."""
+    if path is None:
+        path = _get_data_dir() / SUMMARIES_FILENAME
+    _write_json(path, summarise_profiles(profiles))
+    return path
+
+
 def save_suggestions(results: dict, path: Path | None = None) -> Path:
     """Save learning suggestions (corrections, patterns) to JSON file."""
     if path is None:
@@ -559,12 +936,104 @@ def save_suggestions(results: dict, path: Path | None = None) -> Path:
         "transcript_only_words": results["transcript_only_words"],
         "report_only_words": results["report_only_words"],
     }
-    path.write_text(json.dumps(suggestions, indent=2, ensure_ascii=False), encoding="utf-8")
+    _write_json(path, suggestions)
     logger.info("Saved learning suggestions to %s", path)
     return path
 
 
-def run_learning(limit: int = 0, reformat: bool = False) -> dict[str, Any]:
+def _init_format_worker() -> None:
+    """Reformat pool initializer: warm the formatter caches.
+
+    Loading them up front means each worker hits the DB and
+    doctor_profiles.json once instead of racing on the first transcription.
+    """
+    from crowdtrans.transcriber import formatter
+
+    formatter._load_doctor_profiles()
+    formatter._load_word_replacements()
+    formatter._load_custom_corrections()
+
+
+def _format_one(row: tuple) -> dict[str, Any]:
+    """Re-run the regex formatter for one transcription row (worker side)."""
+    from crowdtrans.transcriber.formatter import format_transcript
+
+    (txn_id, transcript_text, modality_code, procedure_description,
+     complaint, doctor_id, given_names, family_name, patient_ur) = row
+    _pn = " ".join(p for p in [given_names, family_name] if p) or None
+    formatted = format_transcript(
+        transcript_text,
+        modality_code=modality_code,
+        procedure_description=procedure_description,
+        clinical_history=complaint,
+        doctor_id=doctor_id,
+        patient_name=_pn,
+        patient_ur=patient_ur,
+    )
+    return {"id": txn_id, "formatted_text": formatted}
+
+
+_REFORMAT_BATCH = 500
+
+
+def reformat_transcriptions(session, workers: int | None = None) -> int:
+    """Re-run the regex formatter over every completed transcription.
+
+    Formatting is pure CPU, so each batch is spread over a pool of
+    `workers` processes (default: one per CPU). ``workers=1`` formats in
+    the calling process instead, without starting a pool. Returns the
+    number of rows reformatted.
+    """
+    # Walk the table in id order, _REFORMAT_BATCH rows at a time. A streaming
+    # yield_per cursor can't survive the per-batch commits, so page by
+    # primary key instead — memory stays bounded either way.
+    query = (
+        session.query(
+            Transcription.id,
+            Transcription.transcript_text,
+            Transcription.modality_code,
+            Transcription.procedure_description,
+            Transcription.complaint,
+            Transcription.doctor_id,
+            Transcription.patient_given_names,
+            Transcription.patient_family_name,
+            Transcription.patient_ur,
+        )
+        .filter(
+            Transcription.status == "complete",
+            Transcription.transcript_text.isnot(None),
+        )
+        .order_by(Transcription.id)
+    )
+    pool = None
+    if workers != 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            mp_context=_POOL_CONTEXT,
+            initializer=_init_format_worker,
+        )
+    count = 0
+    last_id = 0
+    with pool or contextlib.nullcontext():
+        while True:
+            rows = [tuple(r) for r in query.filter(Transcription.id > last_id).limit(_REFORMAT_BATCH)]
+            if not rows:
+                break
+            if pool is not None:
+                mappings = list(pool.map(_format_one, rows, chunksize=25))
+            else:
+                mappings = [_format_one(row) for row in rows]
+            session.bulk_update_mappings(Transcription, mappings)
+            session.commit()
+            last_id = rows[-1][0]
+            count += len(rows)
+            logger.info("  Reformatted %d", count)
+    return count
+
+
+def run_learning(
+    limit: int = 0, reformat: bool = False, full_rebuild: bool = False,
+) -> dict[str, Any]:
     """Run the full learning pipeline.
 
     1. Analyze all transcript-report pairs (including mined typist edits)
@@ -578,10 +1047,11 @@ def run_learning(limit: int = 0, reformat: bool = False) -> dict[str, Any]:
     Returns the analysis results dict.
     """
     logger.info("Starting learning analysis...")
-    results = analyze_pairs(limit=limit)
+    results = analyze_pairs(limit=limit, full_rebuild=full_rebuild)
 
     if results["stats"]["pairs"] == 0:
         logger.warning("No pairs to analyze, skipping profile update")
+        _sweep_report_cache()
         return results
 
     logger.info(
@@ -594,6 +1064,7 @@ def run_learning(limit: int = 0, reformat: bool = False) -> dict[str, Any]:
 
     # Save profiles
     save_profiles(results["doctor_profiles"])
+    save_profile_summaries(results["doctor_profiles"])
 
     # Save suggestions
     save_suggestions(results)
@@ -604,34 +1075,12 @@ def run_learning(limit: int = 0, reformat: bool = False) -> dict[str, Any]:
 
     # Reformat all transcriptions with updated profiles
     if reformat:
-        from crowdtrans.transcriber.formatter import format_transcript
-
         logger.info("Reformatting transcriptions with updated profiles...")
         with SessionLocal() as session:
-            txns = (
-                session.query(Transcription)
-                .filter(
-                    Transcription.status == "complete",
-                    Transcription.transcript_text.isnot(None),
-                )
-                .all()
-            )
-            for i, txn in enumerate(txns, 1):
-                _pn = " ".join(p for p in [txn.patient_given_names, txn.patient_family_name] if p) or None
-                txn.formatted_text = format_transcript(
-                    txn.transcript_text,
-                    modality_code=txn.modality_code,
-                    procedure_description=txn.procedure_description,
-                    clinical_history=txn.complaint,
-                    doctor_id=txn.doctor_id,
-                    patient_name=_pn,
-                    patient_ur=txn.patient_ur,
-                )
-                if i % 500 == 0:
-                    session.commit()
-                    logger.info("  Reformatted %d/%d", i, len(txns))
-            session.commit()
-            logger.info("Reformatted %d transcriptions", len(txns))
+            count = reformat_transcriptions(session)
+        logger.info("Reformatted %d transcriptions", count)
+
+    _sweep_report_cache()
 
     # Log top suggestions
     if results["global_corrections"]:
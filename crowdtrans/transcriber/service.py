@@ -1,42 +1,157 @@
 """Main transcription polling loop — multi-site (Visage + Karisma)."""
 
+import asyncio
 import datetime
+import json
 import logging
+import re
 import signal
+import threading
 import time
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from pathlib import Path
 
+from sqlalchemy import bindparam, literal_column, select, update
+
 from crowdtrans.config import SiteConfig, settings
 from crowdtrans.config_store import get_config_store
-from crowdtrans.database import SessionLocal, get_db
+from crowdtrans.database import SessionLocal, engine, get_db
+from crowdtrans.karisma import (
+    fetch_all_request_notes,
+    fetch_audio_blob,
+    fetch_existing_report_content,
+    fetch_patient_conditions,
+    fetch_worklist_sync_state,
+    fetch_worklist_sync_state_by_accession,
+)
+from crowdtrans.karisma import fetch_new_dictations as fetch_new_karisma_dictations
 from crowdtrans.models import Transcription, Watermark
+from crowdtrans.transcriber.attachments import cache_attachments
+from crowdtrans.transcriber.audio import process_karisma_blob
 from crowdtrans.transcriber.deepgram_client import transcribe_buffer, transcribe_file
 from crowdtrans.transcriber.formatter import format_transcript, format_transcript_hybrid
 from crowdtrans.transcriber.keyterms import get_keyterms
+from crowdtrans.visage import iter_new_dictations
 
 logger = logging.getLogger(__name__)
 
+# Checked by the (threaded) per-site work between dictations; set together
+# with the asyncio shutdown event when SIGTERM/SIGINT arrives.
 _shutdown = False
 
+# How many sites may run a poll cycle at once. Each cycle runs in a worker
+# thread and spends most of its time waiting on the RIS and Deepgram.
+_MAX_CONCURRENT_SITES = 4
+
+# Pending dictations processed in parallel within one site's cycle, and the
+# process-wide cap on dictations in flight to Deepgram across all sites.
+_PROCESS_WORKERS = 4
+_DEEPGRAM_SLOTS = threading.BoundedSemaphore(8)
+
+# How often the supervisor re-reads site configs to start loops for newly
+# enabled sites (disabled sites stop their own loop).
+_SITE_RESCAN_SECONDS = 30
+
+# Site configs are edited from the web UI (another process), so they are
+# re-read from the config store at most this often rather than every cycle.
+_SITE_CONFIG_TTL_SECONDS = 30
+_site_configs: list[SiteConfig] = []
+_site_configs_at: float | None = None
+
 
-def _handle_signal(signum, frame):
+def _enabled_site_configs() -> list[SiteConfig]:
+    """Enabled site configs, cached for _SITE_CONFIG_TTL_SECONDS."""
+    global _site_configs, _site_configs_at
+    now = time.monotonic()
+    if _site_configs_at is None or now - _site_configs_at >= _SITE_CONFIG_TTL_SECONDS:
+        _site_configs = get_config_store().get_enabled_site_configs()
+        _site_configs_at = now
+    return _site_configs
+
+
+def _handle_signal(signum):
     global _shutdown
     logger.info("Received signal %s, shutting down gracefully...", signum)
     _shutdown = True
 
 
-def _sleep_interruptible(seconds: int):
-    """Sleep in 1-second increments for responsive shutdown."""
-    for _ in range(seconds):
-        if _shutdown:
-            return
-        time.sleep(1)
+# AIMD batch sizing: grow the per-cycle batch additively while a busy cycle
+# finishes within the SLO, cut it by 10% when one overruns.
+_BATCH_CYCLE_SLO_SECONDS = 120
+_BATCH_STEP = 2
+_BATCH_MAX_FACTOR = 5  # ceiling, as a multiple of the configured site.batch_size
+
+
+class _AdaptiveBatch:
+    """Per-site batch size tuned from observed cycle latency."""
+
+    def __init__(self, current: int, minimum: int, maximum: int):
+        self.min = minimum
+        self.max = maximum
+        self.current = max(minimum, min(maximum, current))
+
+    def update(self, elapsed: float) -> bool:
+        """Adjust after a cycle that did work. Returns True if the size changed."""
+        before = self.current
+        if elapsed < _BATCH_CYCLE_SLO_SECONDS:
+            self.current = min(self.max, self.current + _BATCH_STEP)
+        else:
+            self.current = max(self.min, int(self.current * 0.9))
+        return self.current != before
+
+
+# Idle sites back off: each empty cycle doubles the sleep, up to this multiple
+# of the configured poll_interval_seconds; each busy cycle halves it again.
+_IDLE_BACKOFF_MAX_FACTOR = 8
+
+
+class _SiteSchedule:
+    """Per-site poll interval that backs off exponentially while a site is idle."""
+
+    def __init__(self, base: int):
+        self.interval = base
+
+    def after_cycle(self, any_work: bool, base: int) -> int:
+        """Record a cycle's outcome and return how long to sleep before the next one."""
+        if any_work:
+            # Busy: poll again straight away and tighten the idle interval
+            self.interval = max(base, self.interval // 2)
+            return 0
+        sleep = max(base, min(self.interval, base * _IDLE_BACKOFF_MAX_FACTOR))
+        self.interval = min(sleep * 2, base * _IDLE_BACKOFF_MAX_FACTOR)
+        return sleep
+
+
+def _load_batch_size(site_id: str) -> int | None:
+    with SessionLocal() as session:
+        wm = session.query(Watermark).filter_by(site_id=site_id).first()
+        return wm.adaptive_batch_size if wm else None
+
+
+def _save_batch_size(site_id: str, batch_size: int) -> None:
+    with get_db() as session:
+        session.query(Watermark).filter_by(site_id=site_id).update(
+            {Watermark.adaptive_batch_size: batch_size}
+        )
+
+
+async def _wait_for_shutdown(shutdown: asyncio.Event, seconds: float) -> None:
+    """Sleep up to `seconds`, returning immediately if shutdown is requested."""
+    try:
+        await asyncio.wait_for(shutdown.wait(), timeout=seconds)
+    except TimeoutError:
+        pass
 
 
 # ---------------------------------------------------------------------------
 # Visage helpers
 # ---------------------------------------------------------------------------
 
+# Rows pulled off the Visage cursor per existing-id lookup and bulk insert.
+_DISCOVER_CHUNK_SIZE = 500
+
 def _resolve_visage_audio(site: SiteConfig, relative_path: str | None, basename: str) -> Path | None:
     if not relative_path or not site.audio_mount_path:
         return None
@@ -51,26 +166,36 @@ def _resolve_visage_audio(site: SiteConfig, relative_path: str | None, basename:
 
 
 def _discover_visage(session, site: SiteConfig, wm: Watermark) -> int:
-    from crowdtrans.visage import fetch_new_dictations
-
-    rows = fetch_new_dictations(site, wm.last_dictation_id, site.batch_size)
-    if not rows:
-        return 0
-
+    rows = iter_new_dictations(site, wm.last_dictation_id, site.batch_size)
     count = 0
+    seen = 0
     max_id = wm.last_dictation_id
+    while chunk := list(islice(rows, _DISCOVER_CHUNK_SIZE)):
+        seen += len(chunk)
+        count += _insert_visage_rows(session, site, chunk)
+        max_id = max(max_id, chunk[-1]["dictation_id"])
+    if not seen:
+        return 0
+
+    wm.last_dictation_id = max_id
+    wm.last_poll_at = datetime.datetime.utcnow()
+    session.commit()
+
+    if count > 0:
+        logger.info("[%s] Discovered %d new dictations (watermark now %d)", site.site_id, count, max_id)
+    return count
+
+
+def _insert_visage_rows(session, site: SiteConfig, rows: list[dict]) -> int:
+    """Queue inserts for the rows not already tracked; returns the number added."""
+    existing_ids = _existing_dictation_ids(session, site, [row["dictation_id"] for row in rows])
+    to_insert = []
     for row in rows:
         dictation_id = row["dictation_id"]
-        existing = (
-            session.query(Transcription)
-            .filter_by(site_id=site.site_id, source_dictation_id=dictation_id)
-            .first()
-        )
-        if existing:
-            max_id = max(max_id, dictation_id)
+        if dictation_id in existing_ids:
             continue
 
-        t = Transcription(
+        to_insert.append(dict(
             site_id=site.site_id,
             source_dictation_id=dictation_id,
             audio_basename=row["basename"],
@@ -105,18 +230,12 @@ def _discover_visage(session, site: SiteConfig, wm: Watermark) -> int:
             dictation_date=row.get("dictation_date"),
             status="pending",
             discovered_at=datetime.datetime.utcnow(),
-        )
-        session.add(t)
-        max_id = max(max_id, dictation_id)
-        count += 1
-
-    wm.last_dictation_id = max_id
-    wm.last_poll_at = datetime.datetime.utcnow()
-    session.commit()
+        ))
+        existing_ids.add(dictation_id)  # the source may repeat a row within one batch
 
-    if count > 0:
-        logger.info("[%s] Discovered %d new dictations (watermark now %d)", site.site_id, count, max_id)
-    return count
+    if to_insert:
+        session.bulk_insert_mappings(Transcription, to_insert)
+    return len(to_insert)
 
 
 def _process_visage(session, site: SiteConfig, txn: Transcription) -> bool:
@@ -130,9 +249,7 @@ def _process_visage(session, site: SiteConfig, txn: Transcription) -> bool:
 
     keyterms = _build_keyterms(txn)
 
-    txn.status = "transcribing"
-    txn.transcription_started_at = datetime.datetime.utcnow()
-    session.commit()
+    _mark_transcribing(txn)
 
     try:
         result = transcribe_file(audio_path, keyterms)
@@ -156,30 +273,20 @@ def _get_excluded_worksites() -> set[str]:
 
 
 def _discover_karisma(session, site: SiteConfig, wm: Watermark) -> int:
-    import json as _json
-    from crowdtrans.karisma import (
-        fetch_all_request_notes,
-        fetch_new_dictations,
-        fetch_patient_conditions,
-    )
-
-    rows = fetch_new_dictations(site, wm.last_dictation_id, site.batch_size)
+    rows = fetch_new_karisma_dictations(site, wm.last_dictation_id, site.batch_size)
     if not rows:
         return 0
 
     excluded = _get_excluded_worksites()
+    existing_ids = _existing_dictation_ids(session, site, [row["TransactionKey"] for row in rows])
+    to_insert = []
 
     count = 0
     skipped_sites = 0
     max_tk = wm.last_dictation_id
     for row in rows:
         tk = row["TransactionKey"]
-        existing = (
-            session.query(Transcription)
-            .filter_by(site_id=site.site_id, source_dictation_id=tk)
-            .first()
-        )
-        if existing:
+        if tk in existing_ids:
             max_tk = max(max_tk, tk)
             continue
 
@@ -223,11 +330,11 @@ def _discover_karisma(session, site: SiteConfig, wm: Watermark) -> int:
             try:
                 conditions = fetch_patient_conditions(site, patient_key)
                 if conditions:
-                    patient_conditions_json = _json.dumps(conditions)
+                    patient_conditions_json = json.dumps(conditions)
             except Exception:
                 logger.debug("Could not fetch conditions for patient %s", patient_key)
 
-        t = Transcription(
+        to_insert.append(dict(
             site_id=site.site_id,
             source_dictation_id=tk,
             audio_basename=None,
@@ -269,11 +376,13 @@ def _discover_karisma(session, site: SiteConfig, wm: Watermark) -> int:
             dictation_date=row.get("CreatedTime"),
             status="pending",
             discovered_at=datetime.datetime.utcnow(),
-        )
-        session.add(t)
+        ))
+        existing_ids.add(tk)  # the source may repeat a row within one batch
         max_tk = max(max_tk, tk)
         count += 1
 
+    if to_insert:
+        session.bulk_insert_mappings(Transcription, to_insert)
     wm.last_dictation_id = max_tk
     wm.last_poll_at = datetime.datetime.utcnow()
     session.commit()
@@ -287,9 +396,6 @@ def _discover_karisma(session, site: SiteConfig, wm: Watermark) -> int:
 
 
 def _process_karisma(session, site: SiteConfig, txn: Transcription) -> bool:
-    from crowdtrans.karisma import fetch_audio_blob, fetch_existing_report_content
-    from crowdtrans.transcriber.audio import process_karisma_blob
-
     if not txn.extent_key:
         txn.status = "skipped"
         txn.error_message = "No ExtentKey for audio blob"
@@ -329,9 +435,7 @@ def _process_karisma(session, site: SiteConfig, txn: Transcription) -> bool:
 
     keyterms = _build_keyterms(txn)
 
-    txn.status = "transcribing"
-    txn.transcription_started_at = datetime.datetime.utcnow()
-    session.commit()
+    _mark_transcribing(txn)
 
     try:
         result = transcribe_buffer(
@@ -352,30 +456,53 @@ def _process_karisma(session, site: SiteConfig, txn: Transcription) -> bool:
 # Shared helpers
 # ---------------------------------------------------------------------------
 
-_KARISMA_MODALITY_MAP = {
+_KARISMA_MODALITY_MAP = types.MappingProxyType({
     "ultrasound": "US", "ct": "CT", "mri": "MR", "magnetic resonance": "MR",
     "x-ray": "CR", "radiograph": "CR", "mammography": "MG", "mammo": "MG",
     "nuclear medicine": "NM", "bone densitometry": "BMD", "dexa": "BMD",
     "fluoroscopy": "DSA", "angiography": "DSA",
-}
+})
+
+# All partial-match keys in one pattern; group i + 1 is the i-th map key.
+# The lookahead reports every position a key starts at, so the earliest key
+# in map order still wins, as it did with the per-key scan.
+_KARISMA_MODALITY_RE = re.compile(
+    "(?=(?:" + "|".join(f"({re.escape(key)})" for key in _KARISMA_MODALITY_MAP) + "))"
+)
+_KARISMA_MODALITY_CODES = tuple(_KARISMA_MODALITY_MAP.values())
 
 
 def _karisma_modality_to_code(modality_name: str) -> str:
     """Map Karisma's modality name to a standard code for keyterm matching."""
     name_lower = modality_name.strip().lower()
     # Direct match first
-    if name_lower in _KARISMA_MODALITY_MAP:
-        return _KARISMA_MODALITY_MAP[name_lower]
+    code = _KARISMA_MODALITY_MAP.get(name_lower)
+    if code is not None:
+        return code
     # Partial match
-    for key, code in _KARISMA_MODALITY_MAP.items():
-        if key in name_lower:
-            return code
+    hits = [m.lastindex for m in _KARISMA_MODALITY_RE.finditer(name_lower)]
+    if hits:
+        return _KARISMA_MODALITY_CODES[min(hits) - 1]
     # If it's already a short code like "CT", "US", return uppercase
     if len(modality_name) <= 4:
         return modality_name.upper()
     return modality_name
 
 
+# Built once so SQLAlchemy's compiled-statement cache is hit on every cycle.
+_STMT_EXISTING = select(Transcription.source_dictation_id).where(
+    Transcription.site_id == bindparam("sid"),
+    Transcription.source_dictation_id.in_(bindparam("ids", expanding=True)),
+)
+
+
+def _existing_dictation_ids(session, site: SiteConfig, dictation_ids: list[int]) -> set[int]:
+    """Return which of these source dictation ids are already stored for the site."""
+    if not dictation_ids:
+        return set()
+    return set(session.execute(_STMT_EXISTING, {"sid": site.site_id, "ids": dictation_ids}).scalars())
+
+
 def _build_keyterms(txn: Transcription) -> list[str]:
     patient_parts = []
     if txn.patient_given_names:
@@ -393,6 +520,29 @@ def _build_keyterms(txn: Transcription) -> list[str]:
     )
 
 
+_STMT_MARK_TRANSCRIBING = (
+    update(Transcription)
+    .where(Transcription.id == bindparam("txn_id"))
+    .values(status="transcribing", transcription_started_at=bindparam("started_at"))
+)
+
+
+def _mark_transcribing(txn: Transcription) -> None:
+    """Show the dictation as transcribing without committing the session.
+
+    The status is written on its own short connection so the dashboard sees
+    it live, while the item's real changes go out in the single commit made
+    by _store_result or _mark_failed. The start time is also set on the
+    object so that commit records it.
+
+    The caller's session must not have flushed writes yet, or this UPDATE
+    would wait on that session's own SQLite write lock.
+    """
+    txn.transcription_started_at = datetime.datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(_STMT_MARK_TRANSCRIBING, {"txn_id": txn.id, "started_at": txn.transcription_started_at})
+
+
 def _mark_failed(session, site: SiteConfig, txn: Transcription, error: Exception):
     txn.status = "failed"
     txn.error_message = str(error)[:2000]
@@ -452,7 +602,6 @@ def _store_result(session, site: SiteConfig, txn: Transcription, result):
     # Pre-cache referral + worksheet attachments so the worklist detail page
     # renders them instantly without hitting Karisma on every open.
     try:
-        from crowdtrans.transcriber.attachments import cache_attachments
         summary = cache_attachments(site, txn)
         if summary.get("referrals") or summary.get("worksheets"):
             logger.info(
@@ -475,7 +624,6 @@ _BACKFILL_INTERVAL = 600  # 10 minutes
 def _backfill_patient_data(session, site: SiteConfig):
     """Backfill patient/request data for Karisma dictations that were
     discovered before their Report link existed in the database."""
-    import time
     global _last_backfill
 
     now = time.time()
@@ -486,8 +634,6 @@ def _backfill_patient_data(session, site: SiteConfig):
     if site.ris_type != "karisma":
         return
 
-    from crowdtrans.karisma import fetch_all_request_notes
-
     # Find transcriptions missing clinical notes (notes weren't available at discovery)
     missing = (
         session.query(Transcription)
@@ -599,14 +745,6 @@ def _sync_ready_worklist(session, site: SiteConfig, batch_size: int = 2000) -> i
     """
     if site.ris_type != "karisma":
         return 0
-    try:
-        from crowdtrans.karisma import (
-            fetch_worklist_sync_state,
-            fetch_worklist_sync_state_by_accession,
-        )
-    except Exception:
-        return 0
-
     # Newest-first: keeps the sync from getting stuck on a wedge of old
     # orphan dictations at the bottom of the table that have no Karisma
     # Report.Instance to look up. Without this, every batch picks the same
@@ -700,53 +838,165 @@ def _sync_ready_worklist(session, site: SiteConfig, batch_size: int = 2000) -> i
     return moved
 
 
+# Order: urgent dictations first (lowest priority_rank wins), then newest
+# dictation first within each priority bucket. NULL priority sorts last so
+# orphans/unknown-priority items don't preempt prioritised work. The status is
+# inlined rather than bound so SQLite can match the partial ix_pending_queue.
+# Only ids are fetched; each worker loads its own full row.
+_STMT_PENDING = (
+    select(Transcription.id)
+    .where(Transcription.site_id == bindparam("sid"), Transcription.status == literal_column("'pending'"))
+    .order_by(
+        Transcription.priority_rank.asc().nullslast(),
+        Transcription.source_dictation_id.desc(),
+    )
+    .limit(bindparam("lim"))
+)
+
+
 def _process_pending(session, site: SiteConfig) -> int:
     fn = _PROCESS.get(site.ris_type)
     if not fn:
         return 0
 
-    # Order: urgent dictations first (lowest priority_rank wins), then newest
-    # dictation first within each priority bucket. NULL priority sorts last so
-    # orphans/unknown-priority items don't preempt prioritised work.
-    pending = (
-        session.query(Transcription)
-        .filter(Transcription.site_id == site.site_id, Transcription.status == "pending")
-        .order_by(
-            Transcription.priority_rank.asc().nullslast(),
-            Transcription.source_dictation_id.desc(),
-        )
-        .limit(site.batch_size)
-        .all()
-    )
-    if not pending:
+    pending_ids = session.execute(_STMT_PENDING, {"sid": site.site_id, "lim": site.batch_size}).scalars().all()
+    if not pending_ids:
         return 0
 
     success = 0
-    for txn in pending:
-        if _shutdown:
-            break
-        try:
-            if fn(session, site, txn):
+    with ThreadPoolExecutor(max_workers=_PROCESS_WORKERS, thread_name_prefix=f"process-{site.site_id}") as pool:
+        futures = [pool.submit(_process_one, fn, site, txn_id) for txn_id in pending_ids]
+        for future in as_completed(futures):
+            if future.result():
                 success += 1
+            if _shutdown:
+                pool.shutdown(cancel_futures=True)
+                break
+    return success
+
+
+def _process_one(fn, site: SiteConfig, txn_id: int) -> bool:
+    """Process one pending dictation in its own session (run on a worker thread)."""
+    if _shutdown:
+        return False
+    with _DEEPGRAM_SLOTS, get_db() as session:
+        txn = session.get(Transcription, txn_id)
+        if txn is None or txn.status != "pending":
+            return False
+        try:
+            return fn(session, site, txn)
         except Exception:
             logger.exception("[%s] Unexpected error processing dictation %d", site.site_id, txn.source_dictation_id)
-    return success
+            return False
 
 
 # ---------------------------------------------------------------------------
 # Entry points
 # ---------------------------------------------------------------------------
 
+def _poll_site(site: SiteConfig) -> bool:
+    """Run one discover/process/sync cycle for a site. Returns True if any work was done."""
+    try:
+        with get_db() as session:
+            discovered = _discover(session, site)
+            processed = _process_pending(session, site)
+            moved = _sync_ready_worklist(session, site)
+            try:
+                from crowdtrans.transcriber.attachments import maintain as _maintain_cache
+                _maintain_cache(session, site, limit=10)
+            except Exception:
+                logger.exception("[%s] attachment cache maintenance failed", site.site_id)
+            # Backfill disabled — only process new dictations
+            # _backfill_patient_data(session, site)
+            return discovered > 0 or processed > 0 or moved > 0
+    except Exception:
+        logger.exception("[%s] Error in polling loop", site.site_id)
+        return False
+
+
+async def _site_loop(site_id: str, shutdown: asyncio.Event, slots: asyncio.Semaphore):
+    """Poll one site until shutdown or until it is disabled.
+
+    The blocking cycle runs in a worker thread so a slow Deepgram call or RIS
+    query on one site doesn't hold up the others.
+    """
+    batch: _AdaptiveBatch | None = None
+    schedule: _SiteSchedule | None = None
+    saved = await asyncio.to_thread(_load_batch_size, site_id)
+    while not shutdown.is_set():
+        # Re-read the site config each cycle so changes take effect without
+        # restart (within _SITE_CONFIG_TTL_SECONDS)
+        site = next((s for s in _enabled_site_configs() if s.site_id == site_id), None)
+        if site is None:
+            logger.info("[%s] Site no longer enabled, stopping its polling loop", site_id)
+            return
+
+        # Bounds follow the configured batch_size, so editing it in settings
+        # re-anchors the adaptive range.
+        maximum = site.batch_size * _BATCH_MAX_FACTOR
+        if batch is None or batch.max != maximum:
+            start = batch.current if batch else (saved or site.batch_size)
+            batch = _AdaptiveBatch(start, 1, maximum)
+
+        async with slots:
+            if shutdown.is_set():
+                return
+            started = time.monotonic()
+            any_work = await asyncio.to_thread(
+                _poll_site, site.model_copy(update={"batch_size": batch.current}),
+            )
+            elapsed = time.monotonic() - started
+
+        if any_work and batch.update(elapsed):
+            logger.debug(
+                "[%s] Cycle took %.1fs, batch size now %d", site_id, elapsed, batch.current,
+            )
+            await asyncio.to_thread(_save_batch_size, site_id, batch.current)
+
+        if schedule is None:
+            schedule = _SiteSchedule(site.poll_interval_seconds)
+        sleep = schedule.after_cycle(any_work, site.poll_interval_seconds)
+        if sleep:
+            logger.debug("[%s] No work, sleeping %ds", site_id, sleep)
+            await _wait_for_shutdown(shutdown, sleep)
+
+
+async def _run_async(site_id: str | None) -> None:
+    loop = asyncio.get_running_loop()
+    shutdown = asyncio.Event()
+
+    def _on_signal(signum):
+        _handle_signal(signum)
+        shutdown.set()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, _on_signal, sig)
+
+    slots = asyncio.Semaphore(_MAX_CONCURRENT_SITES)
+    tasks: dict[str, asyncio.Task] = {}
+
+    while not shutdown.is_set():
+        sites = _enabled_site_configs()
+        if site_id:
+            sites = [s for s in sites if s.site_id == site_id]
+        for site in sites:
+            task = tasks.get(site.site_id)
+            if task is None or task.done():
+                tasks[site.site_id] = asyncio.create_task(
+                    _site_loop(site.site_id, shutdown, slots), name=f"poll-{site.site_id}",
+                )
+        await _wait_for_shutdown(shutdown, _SITE_RESCAN_SECONDS)
+
+    # Let in-flight cycles finish their current dictation
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+
 def run(site_id: str | None = None):
     """Main entry point. If site_id is None, processes all enabled sites."""
     global _shutdown
     _shutdown = False
 
-    signal.signal(signal.SIGTERM, _handle_signal)
-    signal.signal(signal.SIGINT, _handle_signal)
-
-    store = get_config_store()
-    initial_sites = store.get_enabled_site_configs()
+    initial_sites = _enabled_site_configs()
     if site_id:
         initial_sites = [s for s in initial_sites if s.site_id == site_id]
         if not initial_sites:
@@ -756,37 +1006,6 @@ def run(site_id: str | None = None):
     site_names = ", ".join(s.site_id for s in initial_sites)
     logger.info("Transcription service starting for sites: %s", site_names)
 
-    while not _shutdown:
-        # Re-read site configs each cycle so changes take effect without restart
-        sites = store.get_enabled_site_configs()
-        if site_id:
-            sites = [s for s in sites if s.site_id == site_id]
-
-        any_work = False
-        for site in sites:
-            if _shutdown:
-                break
-            try:
-                with get_db() as session:
-                    discovered = _discover(session, site)
-                    processed = _process_pending(session, site)
-                    moved = _sync_ready_worklist(session, site)
-                    try:
-                        from crowdtrans.transcriber.attachments import maintain as _maintain_cache
-                        _maintain_cache(session, site, limit=10)
-                    except Exception:
-                        logger.exception("[%s] attachment cache maintenance failed", site.site_id)
-                    if discovered > 0 or processed > 0 or moved > 0:
-                        any_work = True
-                    # Backfill disabled — only process new dictations
-                    # _backfill_patient_data(session, site)
-            except Exception:
-                logger.exception("[%s] Error in polling loop", site.site_id)
-
-        if not any_work and not _shutdown:
-            # Use shortest poll interval across active sites
-            interval = min(s.poll_interval_seconds for s in sites)
-            logger.debug("No work across all sites, sleeping %ds", interval)
-            _sleep_interruptible(interval)
+    asyncio.run(_run_async(site_id))
 
     logger.info("Transcription service stopped")
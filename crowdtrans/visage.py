@@ -1,10 +1,16 @@
 """Read-only PostgreSQL client for Visage RIS dictation data."""
 
+import atexit
 import logging
+import threading
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import psycopg2
 import psycopg2.extras
+from psycopg2.pool import ThreadedConnectionPool
 
 from crowdtrans.config import SiteConfig
 
@@ -42,39 +48,98 @@ LIMIT %s;
 """
 
 
-def _get_connection(site: SiteConfig):
-    return psycopg2.connect(
-        host=site.db_host,
-        port=site.db_port,
-        dbname=site.db_name,
-        user=site.db_user,
-        password=site.db_password,
-        options="-c default_transaction_read_only=on",
-        cursor_factory=psycopg2.extras.RealDictCursor,
-    )
+_FETCH_ITERSIZE = 500
 
+_POOL_MIN_CONN = 1
+_POOL_MAX_CONN = 4
 
-def fetch_new_dictations(site: SiteConfig, after_id: int, limit: int) -> list[dict[str, Any]]:
-    """Fetch dictations with id > after_id, returning up to `limit` rows."""
-    conn = _get_connection(site)
+# One pool per distinct RIS database, shared by the poller and the web UI.
+_POOLS: dict[tuple, ThreadedConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(site: SiteConfig) -> ThreadedConnectionPool:
+    # The password is part of the key so that editing it in settings
+    # starts a fresh pool instead of reusing stale credentials.
+    key = (site.db_host, site.db_port, site.db_name, site.db_user, site.db_password)
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None:
+                pool = ThreadedConnectionPool(
+                    _POOL_MIN_CONN,
+                    _POOL_MAX_CONN,
+                    host=site.db_host,
+                    port=site.db_port,
+                    dbname=site.db_name,
+                    user=site.db_user,
+                    password=site.db_password,
+                    options="-c default_transaction_read_only=on",
+                    cursor_factory=psycopg2.extras.RealDictCursor,
+                )
+                _POOLS[key] = pool
+    return pool
+
+
+@contextmanager
+def _get_connection(site: SiteConfig) -> Iterator[Any]:
+    """Borrow a pooled connection, returning it to the pool on exit.
+
+    Connections that were closed or hit a connection-level error are
+    discarded rather than handed back out.
+    """
+    pool = _get_pool(site)
+    conn = pool.getconn()
+    if conn.closed:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
+    broken = False
     try:
-        with conn.cursor() as cur:
-            cur.execute(DICTATION_QUERY, (after_id, limit))
-            rows = cur.fetchall()
-            return [dict(row) for row in rows]
+        yield conn
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        broken = True
+        raise
     finally:
-        conn.close()
+        if not broken and not conn.closed:
+            try:
+                # End the implicit read-only transaction before reuse.
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+        pool.putconn(conn, close=broken or bool(conn.closed))
+
+
+@atexit.register
+def _close_pools() -> None:
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.closeall()
+        _POOLS.clear()
+
+
+def iter_new_dictations(site: SiteConfig, after_id: int, limit: int) -> Iterator[dict[str, Any]]:
+    """Yield dictations with id > after_id, up to `limit` rows.
+
+    Rows are streamed through a server-side cursor, `_FETCH_ITERSIZE` at a
+    time, so the full batch is never held in memory.
+    """
+    with _get_connection(site) as conn, conn.cursor(name=f"dict_{uuid.uuid4().hex}") as cur:
+        cur.itersize = _FETCH_ITERSIZE
+        cur.execute(DICTATION_QUERY, (after_id, limit))
+        yield from cur
+
+
+def fetch_new_dictations(site: SiteConfig, after_id: int, limit: int) -> list[dict[str, Any]]:
+    """Fetch dictations with id > after_id, returning up to `limit` rows."""
+    return list(iter_new_dictations(site, after_id, limit))
 
 
 def check_connection(site: SiteConfig) -> dict[str, Any]:
     """Test connectivity and return basic table counts."""
-    conn = _get_connection(site)
-    try:
-        with conn.cursor() as cur:
-            counts = {}
-            for table in ["dictation", "dictation_procedure", "procedure_", "patient", "doctor"]:
-                cur.execute(f"SELECT COUNT(*) AS cnt FROM {table}")  # noqa: S608
-                counts[table] = cur.fetchone()["cnt"]
-            return {"status": "ok", "counts": counts}
-    finally:
-        conn.close()
+    with _get_connection(site) as conn, conn.cursor() as cur:
+        counts = {}
+        for table in ["dictation", "dictation_procedure", "procedure_", "patient", "doctor"]:
+            cur.execute(f"SELECT COUNT(*) AS cnt FROM {table}")  # noqa: S608
+            counts[table] = cur.fetchone()["cnt"]
+        return {"status": "ok", "counts": counts}
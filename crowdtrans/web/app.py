@@ -61,11 +61,24 @@ class _AuthMiddleware:
         return await self.app(scope, receive, send)
 
 
+class _SessionMiddleware(SessionMiddleware):
+    """SessionMiddleware that leaves static assets alone.
+
+    Static files need no session, so they skip the signed-cookie decode on
+    the way in and the re-signed Set-Cookie header on the way out.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/static/"):
+            return await self.app(scope, receive, send)
+        await super().__call__(scope, receive, send)
+
+
 # Order matters: add_middleware wraps in reverse order, so SessionMiddleware
 # is added last but runs first (outermost), then AuthMiddleware checks session.
 app.add_middleware(_AuthMiddleware)
 app.add_middleware(
-    SessionMiddleware,
+    _SessionMiddleware,
     secret_key=_SESSION_SECRET,
     session_cookie="crowdscription_session",
     max_age=28800,  # 8 hours
@@ -75,6 +88,10 @@ app.add_middleware(
 app.mount("/static", StaticFiles(directory=WEB_DIR / "static"), name="static")
 
 templates = Jinja2Templates(directory=WEB_DIR / "templates")
+# Templates ship with the code and the server runs without --reload, so
+# skip the per-render stat() that checks each cached template (and every
+# base/partial it extends or includes) for edits on disk.
+templates.env.auto_reload = False
 
 
 def _get_ris_name() -> str:
@@ -87,7 +104,14 @@ def _get_ris_name() -> str:
         return "Visage"
 
 
-templates.env.globals["ris_name"] = _get_ris_name
+# Read once when the app starts rather than on every template render.
+templates.env.globals["ris_name"] = "Visage"
+
+
+@app.on_event("startup")
+def refresh_ris_name() -> None:
+    """Recompute the ``ris_name`` template global; call after ris_type changes."""
+    templates.env.globals["ris_name"] = _get_ris_name()
 
 
 def _from_json(value):
@@ -1,12 +1,16 @@
 """JSON + HTMX API endpoints."""
 
 import datetime
+import functools
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import FileResponse, Response
-from sqlalchemy import func, or_
+from sqlalchemy import case, func, or_
 
 from crowdtrans.config_store import get_config_store
 from crowdtrans.database import SessionLocal
@@ -34,29 +38,29 @@ def _build_stats_snapshot(site: str = "") -> dict:
         if site:
             base = base.filter(Transcription.site_id == site)
 
+        # One grouped pass gives the status counts plus the average confidence
+        # and today's completions, which are read off the "complete" group.
+        today_start = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
         status_rows = (
-            base.with_entities(Transcription.status, func.count())
+            base.with_entities(
+                Transcription.status,
+                func.count(),
+                func.avg(Transcription.confidence),
+                func.count(case((Transcription.transcription_completed_at >= today_start, 1))),
+            )
             .group_by(Transcription.status)
             .all()
         )
-        status_counts = dict(status_rows)
+        status_counts = {}
+        avg_confidence = None
+        today_count = 0
+        for status, count, avg, completed_today in status_rows:
+            status_counts[status] = count
+            if status == "complete":
+                avg_confidence = avg
+                today_count = completed_today
         total = sum(status_counts.values())
 
-        avg_confidence = (
-            base.filter(Transcription.status == "complete")
-            .with_entities(func.avg(Transcription.confidence))
-            .scalar()
-        )
-
-        today = datetime.date.today()
-        today_count = (
-            base.filter(
-                Transcription.transcription_completed_at >= datetime.datetime.combine(today, datetime.time.min),
-                Transcription.status == "complete",
-            )
-            .count()
-        )
-
         recent_rows = (
             base.filter(Transcription.status == "complete")
             .order_by(Transcription.transcription_completed_at.desc())
@@ -226,6 +230,56 @@ async def stream_stats(request: Request, site: str = Query("", description="Filt
     )
 
 
+# Decoded Karisma audio for the last few transcriptions played. A browser
+# seeking through a recording issues a Range request per seek, and without
+# this each one re-fetches and re-decompresses the whole blob.
+_KARISMA_AUDIO_CACHE_SIZE = 8
+_karisma_audio: OrderedDict[tuple, tuple[bytes, str]] = OrderedDict()
+_karisma_audio_lock = threading.Lock()
+
+
+def _karisma_audio_for(site_cfg, txn) -> tuple[bytes, str]:
+    from crowdtrans.karisma import fetch_audio_blob
+    from crowdtrans.transcriber.audio import process_karisma_blob
+
+    key = (txn.id, txn.extent_key, txn.extent_offset, txn.extent_length)
+    with _karisma_audio_lock:
+        cached = _karisma_audio.get(key)
+        if cached is not None:
+            _karisma_audio.move_to_end(key)
+            return cached
+
+    raw_blob = fetch_audio_blob(site_cfg, txn.extent_key)
+    if raw_blob is None:
+        raise HTTPException(status_code=404, detail="Audio blob not found in database")
+
+    audio = process_karisma_blob(
+        raw_blob, txn.extent_offset, txn.extent_length, txn.source_dictation_id,
+    )
+    if audio is None:
+        raise HTTPException(status_code=500, detail="Audio decompression failed")
+
+    result = (audio.data, audio.content_type)
+    with _karisma_audio_lock:
+        _karisma_audio[key] = result
+        while len(_karisma_audio) > _KARISMA_AUDIO_CACHE_SIZE:
+            _karisma_audio.popitem(last=False)
+    return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_audio_path(mount: str, relative_path: str, basename: str) -> str:
+    """Locate a Visage audio file, preferring the ``.opus`` name.
+
+    Only hits are cached; a miss raises, so files that appear later are found.
+    """
+    base = Path(mount) / relative_path
+    for candidate in (base / f"{basename}.opus", base / basename):
+        if candidate.exists():
+            return str(candidate)
+    raise FileNotFoundError(basename)
+
+
 @router.get("/audio/{transcription_id}")
 def stream_audio(transcription_id: int, request: Request):
     """Stream the dictation audio file for a transcription."""
@@ -241,21 +295,7 @@ def stream_audio(transcription_id: int, request: Request):
             if not site_cfg:
                 raise HTTPException(status_code=404, detail="Site not configured")
 
-            from crowdtrans.karisma import fetch_audio_blob
-            from crowdtrans.transcriber.audio import process_karisma_blob
-
-            raw_blob = fetch_audio_blob(site_cfg, txn.extent_key)
-            if raw_blob is None:
-                raise HTTPException(status_code=404, detail="Audio blob not found in database")
-
-            audio = process_karisma_blob(
-                raw_blob, txn.extent_offset, txn.extent_length, txn.source_dictation_id,
-            )
-            if audio is None:
-                raise HTTPException(status_code=500, detail="Audio decompression failed")
-
-            data = audio.data
-            content_type = audio.content_type
+            data, content_type = _karisma_audio_for(site_cfg, txn)
             total = len(data)
             filename = txn.accession_number or txn.source_dictation_id
 
@@ -300,17 +340,17 @@ def stream_audio(transcription_id: int, request: Request):
         if not site_cfg or not site_cfg.audio_mount_path:
             raise HTTPException(status_code=404, detail="Audio mount not configured for this site")
 
-        mount = Path(site_cfg.audio_mount_path)
-        audio_path = mount / txn.audio_relative_path / f"{txn.audio_basename}.opus"
-        if not audio_path.exists():
-            audio_path = mount / txn.audio_relative_path / txn.audio_basename
-            if not audio_path.exists():
-                raise HTTPException(status_code=404, detail="Audio file not found on disk")
+        try:
+            audio_path = _resolve_audio_path(
+                site_cfg.audio_mount_path, txn.audio_relative_path, txn.audio_basename,
+            )
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Audio file not found on disk") from None
 
         mime = txn.audio_mime_type or "audio/ogg"
 
     return FileResponse(
-        path=str(audio_path),
+        path=audio_path,
         media_type=mime,
         filename=f"{txn.accession_number or txn.audio_basename}.opus",
     )
@@ -335,28 +375,12 @@ def retry(transcription_id: int):
 @router.post("/reformat")
 def reformat_all():
     """Re-format all completed transcriptions using the latest formatter."""
-    from crowdtrans.transcriber.formatter import format_transcript
+    from crowdtrans.transcriber.learner import reformat_transcriptions
 
+    # Spawned worker pool, capped so a reformat leaves cores for the
+    # poller and the rest of the web server.
     with SessionLocal() as session:
-        txns = (
-            session.query(Transcription)
-            .filter(Transcription.status == "complete", Transcription.transcript_text.isnot(None))
-            .all()
-        )
-        count = 0
-        for txn in txns:
-            _pn = " ".join(p for p in [txn.patient_given_names, txn.patient_family_name] if p) or None
-            txn.formatted_text = format_transcript(
-                txn.transcript_text,
-                modality_code=txn.modality_code,
-                procedure_description=txn.procedure_description,
-                clinical_history=txn.complaint,
-                doctor_id=txn.doctor_id,
-                patient_name=_pn,
-                patient_ur=txn.patient_ur,
-            )
-            count += 1
-        session.commit()
+        count = reformat_transcriptions(session, workers=min(4, os.cpu_count() or 1))
 
     return {"status": "ok", "reformatted": count}
 
@@ -885,7 +909,7 @@ async def preview_correction(request: Request):
         if modality:
             query = query.filter(Transcription.modality_code == modality)
         if doctor:
-            query = query.filter(Transcription.doctor_family_name.ilike(f"%{doctor}%"))
+            query = query.filter(Transcription.doctor_family_name.like(f"{doctor}%"))
         rows = (
             query.order_by(Transcription.id.desc())
             .limit(max(limit * 4, 100))
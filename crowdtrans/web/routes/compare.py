@@ -1,5 +1,6 @@
 """Compare CrowdScription transcriptions against Karisma typed reports."""
 
+import hashlib
 import logging
 import re
 import time
@@ -7,7 +8,7 @@ from difflib import SequenceMatcher
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from sqlalchemy.exc import OperationalError
+from rapidfuzz.distance import Indel
 
 from sqlalchemy.orm import defer
 
@@ -75,18 +76,34 @@ def _normalise_for_compare(text: str, procedure_description: str | None = None)
 # ── Diff computation ────────────────────────────────────────────────────
 
 
+_WORD_RE = re.compile(r"\S+")
+
+
 def _tokenize(text: str) -> list[str]:
     """Split text into tokens (words + punctuation) preserving newlines."""
     tokens = []
     for line in text.split("\n"):
         if tokens:
             tokens.append("\n")
-        words = re.findall(r"\S+", line)
-        tokens.extend(words)
+        tokens.extend(_WORD_RE.findall(line))
     return tokens
 
 
-def _compute_word_diff(our_text: str, visage_text: str) -> list[dict[str, Any]]:
+def _join_tokens(tokens: list[str]) -> str:
+    """Rejoin tokens from _tokenize into display text."""
+    return " ".join(tokens).replace(" \n ", "\n").replace(" \n", "\n").replace("\n ", "\n")
+
+
+def _compute_word_diff(
+    our_text: str, visage_text: str, matcher: SequenceMatcher | None = None,
+) -> list[dict[str, Any]]:
+    """Word-level diff of two texts; see _word_diff_tokens."""
+    return _word_diff_tokens(_tokenize(our_text or ""), _tokenize(visage_text or ""), matcher)
+
+
+def _word_diff_tokens(
+    our_tokens: list[str], visage_tokens: list[str], matcher: SequenceMatcher | None = None,
+) -> list[dict[str, Any]]:
     """Compute word-level diff between our formatted text and Visage report.
 
     Returns a list of diff segments:
@@ -96,35 +113,182 @@ def _compute_word_diff(our_text: str, visage_text: str) -> list[dict[str, Any]]:
     - delete:  text in our transcript but NOT in visage report (we have extra)
     - insert:  text in visage report but NOT in our transcript (we're missing)
     - replace: text differs between both
+
+    When diffing several texts against the same report, pass one
+    ``matcher`` for all of them: its analysis of the report side is kept
+    between calls.
     """
-    our_tokens = _tokenize(our_text or "")
-    visage_tokens = _tokenize(visage_text or "")
 
-    sm = SequenceMatcher(None, our_tokens, visage_tokens, autojunk=False)
+    # Fast paths: these produce exactly the opcodes SequenceMatcher would
+    if our_tokens == visage_tokens:
+        if not our_tokens:
+            return []
+        chunk = _join_tokens(our_tokens)
+        return [{"type": "equal", "our": chunk, "visage": chunk}]
+    if not our_tokens:
+        return [{"type": "insert", "our": "", "visage": _join_tokens(visage_tokens)}]
+    if not visage_tokens:
+        return [{"type": "delete", "our": _join_tokens(our_tokens), "visage": ""}]
+
+    if matcher is None:
+        matcher = SequenceMatcher(None, autojunk=False)
+    # set_seq2 is a no-op when given the same tokens as the previous call
+    if matcher.b != visage_tokens:
+        matcher.set_seq2(visage_tokens)
+    matcher.set_seq1(our_tokens)
     segments = []
 
-    for tag, i1, i2, j1, j2 in sm.get_opcodes():
-        our_chunk = " ".join(our_tokens[i1:i2]).replace(" \n ", "\n").replace(" \n", "\n").replace("\n ", "\n")
-        visage_chunk = " ".join(visage_tokens[j1:j2]).replace(" \n ", "\n").replace(" \n", "\n").replace("\n ", "\n")
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
         segments.append({
             "type": tag,
-            "our": our_chunk,
-            "visage": visage_chunk,
+            "our": _join_tokens(our_tokens[i1:i2]),
+            "visage": _join_tokens(visage_tokens[j1:j2]),
         })
 
     return segments
 
 
 def _similarity_ratio(our_text: str, visage_text: str) -> float:
-    """Return 0.0–1.0 similarity ratio between two texts."""
-    if not our_text and not visage_text:
+    """Return 0.0–1.0 similarity ratio between two texts.
+
+    Token-level 2·matches / total-tokens, like SequenceMatcher.ratio(), but
+    rapidfuzz's Indel similarity counts matches as an exact LCS in C++
+    instead of difflib's greedy blocks, so scores can come out slightly
+    higher on reordered text.
+    """
+    if our_text == visage_text:
         return 1.0
     if not our_text or not visage_text:
         return 0.0
-    our_tokens = _tokenize(our_text)
-    visage_tokens = _tokenize(visage_text)
-    sm = SequenceMatcher(None, our_tokens, visage_tokens, autojunk=False)
-    return sm.ratio()
+    return _similarity_ratio_tokens(_tokenize(our_text), _tokenize(visage_text))
+
+
+def _similarity_ratio_tokens(our_tokens: list[str], visage_tokens: list[str]) -> float:
+    """_similarity_ratio for texts already tokenized (and stripped, so that an
+    empty token list means an empty text)."""
+    if our_tokens == visage_tokens:
+        return 1.0
+    if not our_tokens or not visage_tokens:
+        return 0.0
+    return Indel.normalized_similarity(our_tokens, visage_tokens)
+
+
+# Bump when the scoring itself changes so cached scores are recomputed
+_SIMILARITY_VERSION = b"2"
+
+
+def _compare_hash(txn: Transcription, visage_text: str) -> str:
+    """Fingerprint of every input to the cached similarity scores."""
+    h = hashlib.sha1(_SIMILARITY_VERSION)
+    for part in (txn.formatted_text, txn.llm_formatted_text, txn.procedure_description, visage_text):
+        h.update((part or "").encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _score_texts(texts: tuple[str, str | None, str | None, str]) -> tuple[float, float | None]:
+    """(similarity, llm_similarity) for one row's texts and its RIS report."""
+    formatted_text, llm_formatted_text, procedure_description, visage_text = texts
+    visage_tokens = _tokenize(_normalise_for_compare(visage_text))
+    our_tokens = _tokenize(_normalise_for_compare(formatted_text, procedure_description))
+    ratio = _similarity_ratio_tokens(our_tokens, visage_tokens)
+    llm_ratio = None
+    if llm_formatted_text:
+        llm_tokens = _tokenize(_normalise_for_compare(llm_formatted_text, procedure_description))
+        llm_ratio = _similarity_ratio_tokens(llm_tokens, visage_tokens)
+    return ratio, llm_ratio
+
+
+def _cached_similarities(
+    pairs: list[tuple[Transcription, str]],
+) -> list[tuple[float, float | None]]:
+    """Return (similarity, llm_similarity) per (txn, report text) pair.
+
+    Only pairs whose inputs changed since they were last scored are
+    recomputed. Fresh scores are stored on each ``txn``; the caller commits.
+    Misses are scored inline: Indel runs in C++, so a page of them takes a
+    few milliseconds, less than shipping it to worker processes would.
+    """
+    results = []
+    for txn, visage_text in pairs:
+        digest = _compare_hash(txn, visage_text)
+        if txn.compare_hash == digest and txn.compare_similarity is not None:
+            results.append((txn.compare_similarity, txn.compare_llm_similarity))
+            continue
+        ratio, llm_ratio = _score_texts(
+            (txn.formatted_text, txn.llm_formatted_text, txn.procedure_description, visage_text),
+        )
+        txn.compare_similarity = ratio
+        txn.compare_llm_similarity = llm_ratio
+        txn.compare_hash = digest
+        results.append((ratio, llm_ratio))
+    return results
+
+
+# The filter dropdowns only change when a new modality or worksite shows up,
+# so the DISTINCT scans behind them are re-run at most this often.
+_DROPDOWN_TTL_SECONDS = 300
+_dropdowns: tuple[list[str], list[str]] = ([], [])
+_dropdowns_at: float | None = None
+
+
+def _filter_dropdowns(session) -> tuple[list[str], list[str]]:
+    """(modalities, worksites) for the list filters, cached for _DROPDOWN_TTL_SECONDS."""
+    global _dropdowns, _dropdowns_at
+    now = time.monotonic()
+    if _dropdowns_at is None or now - _dropdowns_at >= _DROPDOWN_TTL_SECONDS:
+        modalities = [
+            r[0] for r in session.query(Transcription.modality_code)
+            .filter(Transcription.modality_code.isnot(None), Transcription.site_id == "karisma")
+            .distinct()
+            .order_by(Transcription.modality_code)
+            .all()
+        ]
+        worksites = [
+            r[0] for r in session.query(Transcription.facility_name)
+            .filter(Transcription.facility_name.isnot(None), Transcription.site_id == "karisma")
+            .distinct()
+            .order_by(Transcription.facility_name)
+            .all()
+        ]
+        _dropdowns = (modalities, worksites)
+        _dropdowns_at = now
+    return _dropdowns
+
+
+def _compare_query(session, modality: str, worksite: str, doctor: str):
+    """Completed Karisma transcriptions matching the list filters."""
+    # Heavy columns deferred. formatted_text and llm_formatted_text stay
+    # loaded: they feed the similarity cache key.
+    query = (
+        session.query(Transcription)
+        .options(
+            defer(Transcription.words_json),
+            defer(Transcription.paragraphs_json),
+            defer(Transcription.transcript_text),
+            defer(Transcription.final_text),
+            defer(Transcription.final_report_text),
+            defer(Transcription.existing_report_text),
+            defer(Transcription.complaint),
+            defer(Transcription.reason_for_study),
+            defer(Transcription.patient_conditions),
+            defer(Transcription.worksheet_notes),
+            defer(Transcription.order_notes),
+            defer(Transcription.error_message),
+        )
+        .filter(
+            Transcription.status == "complete",
+            Transcription.formatted_text.isnot(None),
+            Transcription.site_id == "karisma",
+        )
+    )
+    if modality:
+        query = query.filter(Transcription.modality_code == modality)
+    if worksite:
+        query = query.filter(Transcription.facility_name == worksite)
+    if doctor:
+        query = query.filter(Transcription.doctor_family_name.like(f"{doctor}%"))
+    return query
 
 
 # ── Routes ──────────────────────────────────────────────────────────────
@@ -139,50 +303,49 @@ def compare_list(
     sort: str = Query("similarity", description="Sort by: similarity, date, id"),
     page: int = Query(1, ge=1),
 ):
-    """List transcriptions with their matching Karisma reports and similarity scores."""
-    for attempt in range(3):
-        try:
-            return _compare_list_impl(request, modality, worksite, doctor, sort, page)
-        except OperationalError as e:
-            logger.warning("SQLite error on compare list (attempt %d): %s", attempt + 1, e)
-            if attempt < 2:
-                time.sleep(1)
-            else:
-                raise HTTPException(status_code=503, detail="Database temporarily unavailable, please retry")
-
-
-def _compare_list_impl(request, modality, worksite, doctor, sort, page):
+    """List transcriptions with their matching Karisma reports and similarity scores.
+
+    Only the page shell (filters, counts, pagination) is rendered here, from
+    SQLite alone. The rows load from /compare/items once the page is up,
+    since they wait on the Karisma report fetch and any similarity scoring.
+    """
     with SessionLocal() as session:
-        # Base query with heavy columns deferred
-        base_query = (
-            session.query(Transcription)
-            .options(
-                defer(Transcription.words_json),
-                defer(Transcription.paragraphs_json),
-                defer(Transcription.transcript_text),
-            )
-            .filter(
-                Transcription.status == "complete",
-                Transcription.formatted_text.isnot(None),
-                Transcription.site_id == "karisma",
-            )
-        )
-        if modality:
-            base_query = base_query.filter(Transcription.modality_code == modality)
-        if worksite:
-            base_query = base_query.filter(Transcription.facility_name == worksite)
-        if doctor:
-            base_query = base_query.filter(Transcription.doctor_family_name.ilike(f"%{doctor}%"))
-
-        # Get total count (lightweight)
-        total_count = base_query.count()
-
-        # Paginate at database level — sort by date by default
-        # (similarity sort requires loading all rows, so we only support it
-        # for small result sets)
+        # Stats (approximate — based on total count, not matched count)
+        total_matched = _compare_query(session, modality, worksite, doctor).count()
+        total_pages = max(1, (total_matched + PAGE_SIZE - 1) // PAGE_SIZE)
+        modalities, worksites = _filter_dropdowns(session)
+
+    return templates.TemplateResponse("compare/list.html", {
+        "request": request,
+        "total_matched": total_matched,
+        "page": page,
+        "total_pages": total_pages,
+        "modality": modality,
+        "worksite": worksite,
+        "doctor": doctor,
+        "sort": sort,
+        "modalities": modalities,
+        "worksites": worksites,
+    })
+
+
+@router.get("/items")
+def compare_items(
+    request: Request,
+    modality: str = Query(""),
+    worksite: str = Query(""),
+    doctor: str = Query(""),
+    sort: str = Query("similarity"),
+    page: int = Query(1, ge=1),
+):
+    """HTMX partial: one page of compared rows plus the page's avg similarity."""
+    with SessionLocal() as session:
+        # Paginate at database level, newest first; the similarity sort
+        # below only reorders the current page
         offset = (page - 1) * PAGE_SIZE
         page_txns = (
-            base_query.order_by(Transcription.dictation_date.desc().nullslast())
+            _compare_query(session, modality, worksite, doctor)
+            .order_by(Transcription.dictation_date.desc().nullslast())
             .offset(offset)
             .limit(PAGE_SIZE)
             .all()
@@ -193,18 +356,13 @@ def _compare_list_impl(request, modality, worksite, doctor, sort, page):
         visage_reports = _fetch_karisma_reports(dict_ids)
 
         # Build comparison items for this page
+        pairs = [
+            (txn, visage_reports[txn.source_dictation_id])
+            for txn in page_txns
+            if visage_reports.get(txn.source_dictation_id) is not None
+        ]
         items = []
-        for txn in page_txns:
-            visage_text = visage_reports.get(txn.source_dictation_id)
-            if visage_text is None:
-                continue
-            our_norm = _normalise_for_compare(txn.formatted_text, txn.procedure_description)
-            visage_norm = _normalise_for_compare(visage_text)
-            ratio = _similarity_ratio(our_norm, visage_norm)
-            llm_ratio = None
-            if txn.llm_formatted_text:
-                llm_norm = _normalise_for_compare(txn.llm_formatted_text, txn.procedure_description)
-                llm_ratio = _similarity_ratio(llm_norm, visage_norm)
+        for (txn, visage_text), (ratio, llm_ratio) in zip(pairs, _cached_similarities(pairs)):
             items.append({
                 "txn": txn,
                 "similarity": ratio,
@@ -213,63 +371,29 @@ def _compare_list_impl(request, modality, worksite, doctor, sort, page):
                 "our_preview": (txn.formatted_text[:150] + "...") if len(txn.formatted_text) > 150 else txn.formatted_text,
             })
 
-        # Sort within page if requested
-        if sort == "similarity":
-            items.sort(key=lambda x: x["similarity"])
+        # Persist any scores that were (re)computed for this page
+        session.commit()
 
-        # Stats (approximate — based on total count, not matched count)
-        total_matched = total_count
-        avg_similarity = (
-            sum(x["similarity"] for x in items) / len(items) * 100
-            if items else 0
-        )
+    # Sort within page if requested
+    if sort == "similarity":
+        items.sort(key=lambda x: x["similarity"])
 
-        total_pages = max(1, (total_matched + PAGE_SIZE - 1) // PAGE_SIZE)
+    avg_similarity = (
+        sum(x["similarity"] for x in items) / len(items) * 100
+        if items else 0
+    )
 
-        # Filter dropdowns
-        modalities = [
-            r[0] for r in session.query(Transcription.modality_code)
-            .filter(Transcription.modality_code.isnot(None), Transcription.site_id == "karisma")
-            .distinct()
-            .order_by(Transcription.modality_code)
-            .all()
-        ]
-        worksites = [
-            r[0] for r in session.query(Transcription.facility_name)
-            .filter(Transcription.facility_name.isnot(None), Transcription.site_id == "karisma")
-            .distinct()
-            .order_by(Transcription.facility_name)
-            .all()
-        ]
-
-    return templates.TemplateResponse("compare/list.html", {
+    return templates.TemplateResponse("compare/_items.html", {
         "request": request,
         "items": items,
-        "total_matched": total_matched,
         "avg_similarity": avg_similarity,
-        "page": page,
-        "total_pages": total_pages,
-        "modality": modality,
-        "worksite": worksite,
-        "doctor": doctor,
-        "sort": sort,
-        "modalities": modalities,
-        "worksites": worksites,
     })
 
 
 @router.get("/{transcription_id}")
 def compare_detail(request: Request, transcription_id: int):
     """Side-by-side diff of a single transcription vs Visage report."""
-    for attempt in range(3):
-        try:
-            return _compare_detail_impl(request, transcription_id)
-        except OperationalError as e:
-            logger.warning("SQLite error on compare detail (attempt %d): %s", attempt + 1, e)
-            if attempt < 2:
-                time.sleep(1)
-            else:
-                raise HTTPException(status_code=503, detail="Database temporarily unavailable, please retry")
+    return _compare_detail_impl(request, transcription_id)
 
 
 def _compare_detail_impl(request, transcription_id):
@@ -297,17 +421,23 @@ def _compare_detail_impl(request, transcription_id):
         our_norm = _normalise_for_compare(txn.formatted_text, txn.procedure_description)
         visage_norm = _normalise_for_compare(visage_text)
 
-        # Compute diff on normalised text
-        diff_segments = _compute_word_diff(our_norm, visage_norm)
-        similarity = _similarity_ratio(our_norm, visage_norm)
+        # Compute diff on normalised text. Each side is tokenized once for
+        # both the diff and the score, and one matcher serves both diffs
+        # since they share the report side.
+        our_tokens = _tokenize(our_norm)
+        visage_tokens = _tokenize(visage_norm)
+        matcher = SequenceMatcher(None, autojunk=False)
+        diff_segments = _word_diff_tokens(our_tokens, visage_tokens, matcher)
+        similarity = _similarity_ratio_tokens(our_tokens, visage_tokens)
 
         # LLM similarity (when LLM output exists)
         llm_similarity = None
         llm_diff_segments = None
         if txn.llm_formatted_text:
             llm_norm = _normalise_for_compare(txn.llm_formatted_text, txn.procedure_description)
-            llm_similarity = _similarity_ratio(llm_norm, visage_norm)
-            llm_diff_segments = _compute_word_diff(llm_norm, visage_norm)
+            llm_tokens = _tokenize(llm_norm)
+            llm_similarity = _similarity_ratio_tokens(llm_tokens, visage_tokens)
+            llm_diff_segments = _word_diff_tokens(llm_tokens, visage_tokens, matcher)
 
         # Count differences by type
         diff_stats = {"equal": 0, "insert": 0, "delete": 0, "replace": 0}
@@ -4,7 +4,7 @@ import datetime
 
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy import func
+from sqlalchemy import case, func
 
 from crowdtrans.config_store import get_config_store
 from crowdtrans.database import SessionLocal
@@ -28,30 +28,29 @@ def dashboard(request: Request, site: str = Query("", description="Filter by sit
         if site:
             base = base.filter(Transcription.site_id == site)
 
-        # Status counts
+        # Status counts, plus today's completions and the average confidence
+        # read off the "complete" group, in one grouped pass
+        today_start = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
         status_rows = (
-            base.with_entities(Transcription.status, func.count())
+            base.with_entities(
+                Transcription.status,
+                func.count(),
+                func.avg(Transcription.confidence),
+                func.count(case((Transcription.transcription_completed_at >= today_start, 1))),
+            )
             .group_by(Transcription.status)
             .all()
         )
-        status_counts = dict(status_rows)
+        status_counts = {}
+        avg_confidence = None
+        today_count = 0
+        for status, count, avg, completed_today in status_rows:
+            status_counts[status] = count
+            if status == "complete":
+                avg_confidence = avg
+                today_count = completed_today
         total = sum(status_counts.values())
 
-        # Today's transcriptions
-        today = datetime.date.today()
-        today_q = base.filter(
-            Transcription.transcription_completed_at >= datetime.datetime.combine(today, datetime.time.min),
-            Transcription.status == "complete",
-        )
-        today_count = today_q.count()
-
-        # Average confidence
-        avg_confidence = (
-            base.filter(Transcription.status == "complete")
-            .with_entities(func.avg(Transcription.confidence))
-            .scalar()
-        )
-
         # Recent 10 completed
         recent = (
             base.filter(Transcription.status == "complete")
@@ -1,9 +1,9 @@
 """Learning dashboard — view and trigger the continuous learning agent."""
 
-import json
 import logging
 from pathlib import Path
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Request
 from fastapi.responses import JSONResponse
 
@@ -19,44 +19,41 @@ _DATA_PATHS = [
 ]
 
 
-def _load_json(filename: str) -> dict | None:
+# Parsed JSON per file, reused until the file's mtime or size changes
+_JSON_CACHE: dict[Path, tuple[tuple[int, int], dict | list]] = {}
+
+
+def _load_json(filename: str) -> dict | list | None:
     for p in _DATA_PATHS:
         f = p / filename
-        if f.exists():
-            try:
-                return json.loads(f.read_text(encoding="utf-8"))
-            except Exception:
-                pass
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _JSON_CACHE.get(f)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        try:
+            data = orjson.loads(f.read_bytes())
+        except Exception:
+            return None
+        _JSON_CACHE[f] = (key, data)
+        return data
     return None
 
 
 @router.get("/")
 def learning_dashboard(request: Request):
     """Show learning results — profiles, suggestions, correction candidates."""
-    profiles = _load_json("doctor_profiles.json") or {}
     suggestions = _load_json("learning_suggestions.json") or {}
 
-    # Summarise profiles
-    profile_summaries = []
-    for doc_id, profile in profiles.items():
-        modalities = profile.get("modalities", {})
-        total_count = sum(m.get("count", 0) for m in modalities.values())
-        avg_sim = 0
-        if modalities:
-            sims = [m.get("avg_similarity", 0) for m in modalities.values() if m.get("count", 0) > 0]
-            avg_sim = sum(sims) / len(sims) if sims else 0
-        corrections_count = sum(
-            len(m.get("word_corrections", [])) for m in modalities.values()
-        )
-        profile_summaries.append({
-            "doctor_id": doc_id,
-            "name": profile.get("doctor_name", "Unknown"),
-            "modalities": list(modalities.keys()),
-            "total_count": total_count,
-            "avg_similarity": round(avg_sim, 1),
-            "corrections_count": corrections_count,
-        })
-    profile_summaries.sort(key=lambda x: x["total_count"], reverse=True)
+    # Summaries are written by the learner; until it has run once on this
+    # install, fall back to building them from the profiles.
+    profile_summaries = _load_json("profile_summaries.json")
+    if profile_summaries is None:
+        from crowdtrans.transcriber.learner import summarise_profiles
+        profile_summaries = summarise_profiles(_load_json("doctor_profiles.json") or {})
 
     return templates.TemplateResponse("learning/dashboard.html", {
         "request": request,
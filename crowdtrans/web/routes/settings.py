@@ -10,7 +10,7 @@ from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
 from crowdtrans.config_store import get_config_store
 from crowdtrans.database import SessionLocal
 from crowdtrans.models import Radiologist, Transcription
-from crowdtrans.web.app import templates
+from crowdtrans.web.app import refresh_ris_name, templates
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +153,7 @@ def save_global(
         "llm_ab_test_pct": llm_ab_test_pct,
     }
     store.save_globals(data)
+    refresh_ris_name()
 
     # Reset LLM client if API key changed so it picks up the new key
     try:
@@ -1,10 +1,19 @@
 """Transcription browse/search/detail routes."""
 
-from fastapi import APIRouter, HTTPException, Query, Request
-from sqlalchemy import func, or_
+import csv
+import datetime
+import hashlib
+import io
+import re
+import time
 
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import column, func, or_, text, tuple_
+
+from crowdtrans.config import SiteConfig
 from crowdtrans.config_store import get_config_store
-from crowdtrans.database import SessionLocal
+from crowdtrans.database import SEARCH_TABLE, SessionLocal, has_search_index
 from crowdtrans.models import Transcription
 from crowdtrans.web.app import templates
 
@@ -12,64 +21,133 @@ router = APIRouter(prefix="/transcriptions")
 
 PAGE_SIZE = 25
 
+_LIST_COLUMNS = (
+    Transcription.id,
+    Transcription.facility_name,
+    Transcription.accession_number,
+    Transcription.patient_family_name,
+    Transcription.patient_given_names,
+    Transcription.patient_ur,
+    Transcription.modality_code,
+    Transcription.procedure_description,
+    Transcription.doctor_family_name,
+    Transcription.status,
+    Transcription.dictation_date,
+)
 
-@router.get("/")
-def list_transcriptions(
-    request: Request,
-    q: str = Query("", description="Search query"),
-    site: str = Query("", description="Filter by site"),
-    worksite: str = Query("", description="Filter by worksite"),
-    status: str = Query("", description="Filter by status"),
-    modality: str = Query("", description="Filter by modality code"),
-    doctor: str = Query("", description="Filter by doctor family name"),
-    date_from: str = Query("", description="Filter from date (YYYY-MM-DD)"),
-    date_to: str = Query("", description="Filter to date (YYYY-MM-DD)"),
-    page: int = Query(1, ge=1),
+# Search text shaped like an accession number or UR: tried as an exact
+# match on those two indexed columns before any substring search.
+_IDENTIFIER_RE = re.compile(r"(?=[A-Z0-9]{5,20}$)[A-Z]*\d[A-Z0-9]*")
+
+# Trigram FTS5 lookup: a quoted phrase matches as a substring of any search
+# column, case-insensitively — the same rows as the ILIKE fan-out below.
+_SEARCH_IDS = text(
+    f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match"
+).columns(column("rowid"))
+
+
+def _parse_day(value: str, name: str) -> datetime.date | None:
+    """Parse a YYYY-MM-DD filter value. The filter form always submits the
+    field, so an empty string means "no filter" rather than a 422."""
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}, expected YYYY-MM-DD") from None
+
+
+def _page_after_cursor(query, before_date: str, before_id: int, limit: int) -> list:
+    """Up to `limit` rows of the ordered `query` that follow the cursor row
+    (before_date, before_id) in dictation_date DESC NULLS LAST, id DESC order.
+    An empty before_date means the cursor row is already in the undated tail.
+
+    The dated rows are fetched with a row-value comparison, which SQLite can
+    answer by seeking the (dictation_date, id) index. Folding the undated
+    tail into the same predicate with OR would turn that seek back into a
+    scan, so the tail is topped up with a second query when the dated rows
+    run out.
+    """
+    undated = query.filter(Transcription.dictation_date.is_(None))
+    if not before_date:
+        return undated.filter(Transcription.id < before_id).limit(limit).all()
+    try:
+        cursor_date = datetime.datetime.fromisoformat(before_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid before_date") from None
+    rows = (
+        query.filter(tuple_(Transcription.dictation_date, Transcription.id) < tuple_(cursor_date, before_id))
+        .limit(limit)
+        .all()
+    )
+    if len(rows) < limit:
+        rows += undated.limit(limit - len(rows)).all()
+    return rows
+
+
+def _apply_filters(
+    session, query, q: str, site: str, worksite: str, status: str,
+    modality: str, doctor: str, date_from: str, date_to: str,
 ):
-    with SessionLocal() as session:
-        query = session.query(Transcription)
-
-        if site:
-            query = query.filter(Transcription.site_id == site)
-        if worksite:
-            query = query.filter(Transcription.facility_name == worksite)
-
-        if q:
-            like = f"%{q}%"
-            query = query.filter(
-                or_(
-                    Transcription.accession_number.ilike(like),
-                    Transcription.patient_family_name.ilike(like),
-                    Transcription.patient_given_names.ilike(like),
-                    Transcription.patient_ur.ilike(like),
-                    Transcription.transcript_text.ilike(like),
-                    Transcription.procedure_description.ilike(like),
-                )
-            )
+    """Narrow `query` by the list's search text and filter fields."""
+    if site:
+        query = query.filter(Transcription.site_id == site)
+    if worksite:
+        query = query.filter(Transcription.facility_name == worksite)
 
-        if status:
-            query = query.filter(Transcription.status == status)
-        if modality:
-            query = query.filter(Transcription.modality_code == modality)
-        if doctor:
-            query = query.filter(Transcription.doctor_family_name == doctor)
-        if date_from:
-            query = query.filter(Transcription.dictation_date >= date_from)
-        if date_to:
-            query = query.filter(Transcription.dictation_date <= date_to + " 23:59:59")
-
-        total = query.count()
-        total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
-        offset = (page - 1) * PAGE_SIZE
-
-        items = (
-            query.order_by(Transcription.dictation_date.desc().nullslast(), Transcription.id.desc())
-            .offset(offset)
-            .limit(PAGE_SIZE)
-            .all()
+    exact = None
+    if q and _IDENTIFIER_RE.fullmatch(q):
+        exact = or_(Transcription.accession_number == q, Transcription.patient_ur == q)
+        if session.query(Transcription.id).filter(exact).first() is None:
+            exact = None
+
+    if exact is not None:
+        query = query.filter(exact)
+    elif q and len(q) >= 3 and has_search_index():
+        # Trigrams need at least three characters to match on
+        match = '"' + q.replace('"', '""') + '"'
+        query = query.filter(Transcription.id.in_(_SEARCH_IDS.bindparams(match=match)))
+    elif q:
+        like = f"%{q}%"
+        query = query.filter(
+            or_(
+                Transcription.accession_number.ilike(like),
+                Transcription.patient_family_name.ilike(like),
+                Transcription.patient_given_names.ilike(like),
+                Transcription.patient_ur.ilike(like),
+                Transcription.transcript_text.ilike(like),
+                Transcription.procedure_description.ilike(like),
+            )
         )
 
-        # Filter dropdowns
+    if status:
+        query = query.filter(Transcription.status == status)
+    if modality:
+        query = query.filter(Transcription.modality_code == modality)
+    if doctor:
+        query = query.filter(Transcription.doctor_family_name == doctor)
+    day_from = _parse_day(date_from, "date_from")
+    if day_from:
+        query = query.filter(Transcription.dictation_date >= datetime.datetime.combine(day_from, datetime.time.min))
+    day_to = _parse_day(date_to, "date_to")
+    if day_to:
+        day_after = day_to + datetime.timedelta(days=1)
+        query = query.filter(Transcription.dictation_date < datetime.datetime.combine(day_after, datetime.time.min))
+    return query
+
+
+# The filter dropdowns change only when a new modality, status, worksite or
+# doctor appears, so their DISTINCT scans re-run at most this often.
+_FILTER_OPTIONS_TTL_SECONDS = 60
+_filter_options_cache: tuple[list[str], list[str], list[str], list[str]] = ([], [], [], [])
+_filter_options_at: float | None = None
+
+
+def _filter_options(session) -> tuple[list[str], list[str], list[str], list[str]]:
+    """(modalities, statuses, worksites, doctors), cached for _FILTER_OPTIONS_TTL_SECONDS."""
+    global _filter_options_cache, _filter_options_at
+    now = time.monotonic()
+    if _filter_options_at is None or now - _filter_options_at >= _FILTER_OPTIONS_TTL_SECONDS:
         modalities = [
             r[0] for r in session.query(Transcription.modality_code)
             .filter(Transcription.modality_code.isnot(None))
@@ -97,14 +175,124 @@ def list_transcriptions(
             .order_by(Transcription.doctor_family_name)
             .all()
         ]
-        site_configs = get_config_store().get_site_configs()
+        _filter_options_cache = (modalities, statuses, worksites, doctors)
+        _filter_options_at = now
+    return _filter_options_cache
+
+
+# Site configs are edited rarely, from the settings page; picking up an
+# edit within this long is fine for the list's site dropdown and the
+# detail page's site name.
+_SITE_CONFIG_TTL_SECONDS = 30
+_site_configs_cache: list[SiteConfig] = []
+_site_configs_by_id: dict[str, SiteConfig] = {}
+_site_configs_at: float | None = None
+
+
+def _site_configs() -> list[SiteConfig]:
+    """All site configs, cached for _SITE_CONFIG_TTL_SECONDS."""
+    global _site_configs_cache, _site_configs_by_id, _site_configs_at
+    now = time.monotonic()
+    if _site_configs_at is None or now - _site_configs_at >= _SITE_CONFIG_TTL_SECONDS:
+        _site_configs_cache = get_config_store().get_site_configs()
+        _site_configs_by_id = {s.site_id: s for s in _site_configs_cache}
+        _site_configs_at = now
+    return _site_configs_cache
+
+
+def _site_by_id(site_id: str) -> SiteConfig | None:
+    _site_configs()
+    site_cfg = _site_configs_by_id.get(site_id)
+    if site_cfg is None:
+        # Not among the configured sites (e.g. deleted since) — fall back
+        # to the store, which also consults the .env sites.
+        site_cfg = get_config_store().get_site(site_id)
+    return site_cfg
+
+
+# Browse pages (no search text) are served with an ETag so that flipping
+# back and forth between pages can be answered from the browser cache or
+# with a 304. New rows bump max(id); in-place status changes don't, so the
+# tag also rolls over every _LIST_ETAG_WINDOW_SECONDS.
+_LIST_CACHE_CONTROL = "private, max-age=30"
+_LIST_ETAG_WINDOW_SECONDS = 30
+
+
+def _list_etag(request: Request, max_id: int) -> str:
+    user = request.session.get("user") or {}
+    window = int(time.time() // _LIST_ETAG_WINDOW_SECONDS)
+    key = f"{max_id}:{window}:{user.get('username', '')}:{request.url.query}"
+    return '"' + hashlib.md5(key.encode()).hexdigest() + '"'
 
-    return templates.TemplateResponse("transcriptions/list.html", {
+
+@router.get("/")
+def list_transcriptions(
+    request: Request,
+    q: str = Query("", description="Search query"),
+    site: str = Query("", description="Filter by site"),
+    worksite: str = Query("", description="Filter by worksite"),
+    status: str = Query("", description="Filter by status"),
+    modality: str = Query("", description="Filter by modality code"),
+    doctor: str = Query("", description="Filter by doctor family name"),
+    date_from: str = Query("", description="Filter from date (YYYY-MM-DD)"),
+    date_to: str = Query("", description="Filter to date (YYYY-MM-DD)"),
+    page: int = Query(1, ge=1),
+    before_date: str = Query("", description="Keyset cursor: dictation_date of the previous page's last row"),
+    before_id: int | None = Query(None, description="Keyset cursor: id of the previous page's last row"),
+):
+    with SessionLocal() as session:
+        etag = None
+        if not q:
+            max_id = session.query(func.max(Transcription.id)).scalar() or 0
+            etag = _list_etag(request, max_id)
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _LIST_CACHE_CONTROL})
+
+        # Only the columns the list table shows — full rows would drag
+        # transcript_text and the JSON timing blobs along for every item
+        query = session.query(*_LIST_COLUMNS)
+
+        query = _apply_filters(
+            session, query, q, site, worksite, status, modality, doctor, date_from, date_to,
+        )
+
+        # No exact count: it re-runs the whole filtered scan just to label
+        # the pager. Unfiltered, the highest id is a close, index-only
+        # estimate of the table size; filtered, only "Page N" is shown.
+        filtered = any((q, site, worksite, status, modality, doctor, date_from, date_to))
+        if filtered:
+            total = None
+        elif etag is not None:
+            total = max_id
+        else:
+            total = session.query(func.max(Transcription.id)).scalar() or 0
+
+        # "Next" links carry the last row's sort key, so deep pages seek
+        # straight to it instead of scanning and discarding OFFSET rows.
+        # Plain ?page=N (Previous links, old bookmarks) still uses OFFSET.
+        # One extra row tells us whether there is a next page.
+        query = query.order_by(Transcription.dictation_date.desc().nullslast(), Transcription.id.desc())
+        if before_id is not None:
+            items = _page_after_cursor(query, before_date, before_id, PAGE_SIZE + 1)
+        else:
+            items = query.offset((page - 1) * PAGE_SIZE).limit(PAGE_SIZE + 1).all()
+        has_next = len(items) > PAGE_SIZE
+        items = items[:PAGE_SIZE]
+        next_cursor = None
+        if items:
+            last = items[-1]
+            next_cursor = (last.dictation_date.isoformat() if last.dictation_date else "", last.id)
+
+        modalities, statuses, worksites, doctors = _filter_options(session)
+        site_configs = _site_configs()
+
+    response = templates.TemplateResponse("transcriptions/list.html", {
         "request": request,
         "items": items,
         "total": total,
         "page": page,
-        "total_pages": total_pages,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
         "q": q,
         "site": site,
         "worksite": worksite,
@@ -119,6 +307,60 @@ def list_transcriptions(
         "doctors": doctors,
         "site_configs": site_configs,
     })
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _LIST_CACHE_CONTROL
+    return response
+
+
+_EXPORT_BATCH = 1000
+
+
+@router.get("/export.csv")
+def export_csv(
+    q: str = Query("", description="Search query"),
+    site: str = Query("", description="Filter by site"),
+    worksite: str = Query("", description="Filter by worksite"),
+    status: str = Query("", description="Filter by status"),
+    modality: str = Query("", description="Filter by modality code"),
+    doctor: str = Query("", description="Filter by doctor family name"),
+    date_from: str = Query("", description="Filter from date (YYYY-MM-DD)"),
+    date_to: str = Query("", description="Filter to date (YYYY-MM-DD)"),
+):
+    """Every transcription matching the list filters, as CSV.
+
+    Rows are fetched _EXPORT_BATCH at a time and written out as they
+    arrive, so a large export never sits in memory all at once.
+    """
+    session = SessionLocal()
+    try:
+        query = _apply_filters(
+            session, session.query(*_LIST_COLUMNS),
+            q, site, worksite, status, modality, doctor, date_from, date_to,
+        )
+    except Exception:
+        session.close()
+        raise
+    query = query.order_by(Transcription.dictation_date.desc().nullslast(), Transcription.id.desc())
+
+    def _rows():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        try:
+            writer.writerow([c.key for c in _LIST_COLUMNS])
+            for batch in session.execute(query.statement).yield_per(_EXPORT_BATCH).partitions():
+                writer.writerows(batch)
+                yield buf.getvalue()
+                buf.seek(0)
+                buf.truncate()
+        finally:
+            session.close()
+
+    return StreamingResponse(
+        _rows(),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="transcriptions.csv"'},
+    )
 
 
 @router.get("/{transcription_id}")
@@ -128,7 +370,7 @@ def detail(request: Request, transcription_id: int):
         if not txn:
             raise HTTPException(status_code=404, detail="Transcription not found")
         # Resolve site name
-        site_cfg = get_config_store().get_site(txn.site_id)
+        site_cfg = _site_by_id(txn.site_id)
         site_name = site_cfg.site_name if site_cfg else txn.site_id
 
     return templates.TemplateResponse("transcriptions/detail.html", {
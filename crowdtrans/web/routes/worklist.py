@@ -90,7 +90,7 @@ def worklist_list(
         if modality:
             base = base.filter(Transcription.modality_code == modality)
         if doctor:
-            base = base.filter(Transcription.doctor_family_name.ilike(f"%{doctor}%"))
+            base = base.filter(Transcription.doctor_family_name.like(f"{doctor}%"))
         if date_from:
             base = base.filter(Transcription.dictation_date >= date_from)
         if date_to:
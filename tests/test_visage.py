@@ -1,30 +1,39 @@
 """Tests for query structure, keyterms, and audio processing."""
 
+import gzip
+
 import pytest
 
+from crowdtrans import karisma, visage
+from crowdtrans.config import settings
+from crowdtrans.transcriber.audio import process_karisma_blob
+from crowdtrans.transcriber.keyterms import get_keyterms
+from crowdtrans.transcriber.learner import _diff_tokens, _tokenize
 
-def test_visage_query_is_valid_sql():
-    from crowdtrans.visage import DICTATION_QUERY
+WAV_DATA = b"RIFF" + b"\x00" * 100
 
-    assert "dictation d" in DICTATION_QUERY
-    assert "dictation_procedure dp" in DICTATION_QUERY
-    assert "procedure_ p" in DICTATION_QUERY
-    assert "ORDER BY d.id ASC" in DICTATION_QUERY
-    assert "LIMIT %s" in DICTATION_QUERY
 
+@pytest.fixture(scope="module")
+def gzipped_wav() -> bytes:
+    return gzip.compress(WAV_DATA)
 
-def test_karisma_query_is_valid_sql():
-    from crowdtrans.karisma import DICTATION_QUERY
 
-    assert "[Version].[Karisma.Dictation.Instance]" in DICTATION_QUERY
-    assert "[Version].[Karisma.Patient.Record]" in DICTATION_QUERY
-    assert "TransactionKey" in DICTATION_QUERY
-    assert "ORDER BY DI.TransactionKey ASC" in DICTATION_QUERY
+def test_visage_query_is_valid_sql():
+    assert "dictation d" in visage.DICTATION_QUERY
+    assert "dictation_procedure dp" in visage.DICTATION_QUERY
+    assert "procedure_ p" in visage.DICTATION_QUERY
+    assert "ORDER BY d.id ASC" in visage.DICTATION_QUERY
+    assert "LIMIT %s" in visage.DICTATION_QUERY
 
 
-def test_keyterms_base():
-    from crowdtrans.transcriber.keyterms import get_keyterms
+def test_karisma_query_is_valid_sql():
+    assert "[Version].[Karisma.Dictation.Instance]" in karisma.DICTATION_QUERY
+    assert "[Version].[Karisma.Patient.Record]" in karisma.DICTATION_QUERY
+    assert "TransactionKey" in karisma.DICTATION_QUERY
+    assert "ORDER BY DI.TransactionKey ASC" in karisma.DICTATION_QUERY
 
+
+def test_keyterms_base():
     terms = get_keyterms()
     assert "radiology" in terms
     assert "impression" in terms
@@ -32,8 +41,6 @@ def test_keyterms_base():
 
 
 def test_keyterms_modality_boost():
-    from crowdtrans.transcriber.keyterms import get_keyterms
-
     us_terms = get_keyterms(modality_code="US")
     assert any("Doppler" in t for t in us_terms)
 
@@ -45,8 +52,6 @@ def test_keyterms_modality_boost():
 
 
 def test_keyterms_cap():
-    from crowdtrans.transcriber.keyterms import get_keyterms
-
     terms = get_keyterms(
         modality_code="CT",
         patient_name_parts=["John", "Alexander", "Smith-Williams"],
@@ -58,18 +63,13 @@ def test_keyterms_cap():
 
 
 def test_audio_processor_wav_passthrough():
-    from crowdtrans.transcriber.audio import process_karisma_blob
-
-    wav_data = b"RIFF" + b"\x00" * 100
-    result = process_karisma_blob(wav_data, None, None, 1)
+    result = process_karisma_blob(WAV_DATA, None, None, 1)
     assert result is not None
     assert result.content_type == "audio/wav"
-    assert result.data == wav_data
+    assert result.data == WAV_DATA
 
 
 def test_audio_processor_with_offset():
-    from crowdtrans.transcriber.audio import process_karisma_blob
-
     # 10 bytes of junk + WAV header
     blob = b"\x00" * 10 + b"RIFF" + b"\x00" * 100
     result = process_karisma_blob(blob, offset=10, length=104, dictation_key=1)
@@ -78,59 +78,64 @@ def test_audio_processor_with_offset():
     assert result.data[:4] == b"RIFF"
 
 
-def test_audio_processor_gzip():
-    import gzip
-    from crowdtrans.transcriber.audio import process_karisma_blob
-
-    original = b"RIFF" + b"\x00" * 100
-    compressed = gzip.compress(original)
-    result = process_karisma_blob(compressed, None, None, 1)
+def test_audio_processor_gzip(gzipped_wav):
+    result = process_karisma_blob(gzipped_wav, None, None, 1)
     assert result is not None
-    assert result.data == original
+    assert result.data == WAV_DATA
     assert result.content_type == "audio/wav"
 
 
 def test_audio_processor_raw_fallback():
-    from crowdtrans.transcriber.audio import process_karisma_blob
-
     raw = b"\xDE\xAD\xBE\xEF" + b"\x00" * 50
     result = process_karisma_blob(raw, None, None, 1)
     assert result is not None
     assert result.content_type == "audio/raw"
 
 
-def test_site_configs():
-    from crowdtrans.config import settings
+def test_diff_tokens_merges_uneven_replacements():
+    # The opcodes split n:m changes into separate inserts/deletes; they must
+    # come back as one phrase pair, as difflib reports them.
+    _, replacements = _diff_tokens(
+        _tokenize("there is a fusion in the knee"), _tokenize("there is effusion in the knee"),
+    )
+    assert replacements == [("a fusion", "effusion")]
+
+    _, replacements = _diff_tokens(_tokenize("near fusion"), _tokenize("knee joint effusion"))
+    assert replacements == [("near fusion", "knee joint effusion")]
+
 
+def test_diff_tokens_keeps_longest_common_subsequence():
+    # A substitution-first alignment would pair x/a and a/y, dropping the
+    # shared "a" and reporting "x a" -> "a y" as a correction.
+    ratio, replacements = _diff_tokens(["x", "a"], ["a", "y"])
+    assert ratio == 0.5
+    assert replacements == []
+
+
+def test_site_configs():
     sites = settings.get_site_configs()
     site_ids = [s.site_id for s in sites]
     assert "visage" in site_ids
     assert "karisma" in site_ids
 
-    visage = settings.get_site("visage")
-    assert visage.ris_type == "visage"
-    assert visage.audio_source == "nfs"
+    visage_site = settings.get_site("visage")
+    assert visage_site.ris_type == "visage"
+    assert visage_site.audio_source == "nfs"
 
-    karisma = settings.get_site("karisma")
-    assert karisma.ris_type == "karisma"
-    assert karisma.audio_source == "sql_blob"
+    karisma_site = settings.get_site("karisma")
+    assert karisma_site.ris_type == "karisma"
+    assert karisma_site.audio_source == "sql_blob"
 
 
 @pytest.mark.skipif(True, reason="Requires live Visage PostgreSQL connection")
 def test_visage_connection():
-    from crowdtrans.config import settings
-    from crowdtrans.visage import check_connection
-
     site = settings.get_site("visage")
-    result = check_connection(site)
+    result = visage.check_connection(site)
     assert result["status"] == "ok"
 
 
 @pytest.mark.skipif(True, reason="Requires live Karisma MSSQL connection")
 def test_karisma_connection():
-    from crowdtrans.config import settings
-    from crowdtrans.karisma import check_connection
-
     site = settings.get_site("karisma")
-    result = check_connection(site)
+    result = karisma.check_connection(site)
     assert result["status"] == "ok"